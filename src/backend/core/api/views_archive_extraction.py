@@ -127,7 +127,13 @@ class ArchiveExtractionStartView(APIView):
                 },
             )
 
-        return Response({"job_id": job_id}, status=status.HTTP_201_CREATED)
+        # Include the current status so callers can skip the first poll when the job
+        # already finished (e.g. eager Celery or very small archives).
+        serializer = ArchiveExtractionStatusSerializer(
+            data=get_archive_extraction_job_status(job_id)
+        )
+        serializer.is_valid(raise_exception=False)
+        return Response({"job_id": job_id, **serializer.data}, status=status.HTTP_201_CREATED)
 
 
 class ArchiveExtractionStatusView(APIView):
@@ -1,6 +1,7 @@
 """API endpoints"""
 # pylint: disable=too-many-lines
 
+import codecs
 import contextlib
 import json
 import logging
@@ -296,17 +297,15 @@ def _decode_text_bytes_best_effort(data: bytes, *, truncated: bool) -> tuple[str
         errors = "replace" if truncated else "strict"
         return data.decode("utf-8-sig", errors=errors), "utf-8", True
 
+    # UTF-16: decode past the BOM without copying; a non-final decode drops a
+    # trailing partial code unit (odd byte or split surrogate) left by truncation.
     if data.startswith(b"\xff\xfe"):
-        payload = data[2:]
-        if len(payload) % 2 == 1:
-            payload = payload[:-1]
-        return payload.decode("utf-16le", errors="replace"), "utf-16le", False
+        text, _ = codecs.utf_16_le_decode(memoryview(data)[2:], "replace", False)
+        return text, "utf-16le", False
 
     if data.startswith(b"\xfe\xff"):
-        payload = data[2:]
-        if len(payload) % 2 == 1:
-            payload = payload[:-1]
-        return payload.decode("utf-16be", errors="replace"), "utf-16be", False
+        text, _ = codecs.utf_16_be_decode(memoryview(data)[2:], "replace", False)
+        return text, "utf-16be", False
 
     try:
         errors = "replace" if truncated else "strict"
@@ -322,6 +321,17 @@ def _normalize_if_match_tag(v: str) -> str:
     return v
 
 
+def _if_none_match_hits(if_none_match: str | None, etag: str) -> bool:
+    """Return True when an `If-None-Match` header matches `etag` (weak comparison)."""
+    raw = str(if_none_match or "").strip()
+    if not raw or not etag:
+        return False
+    if raw == "*":
+        return True
+    current = _normalize_if_match_tag(etag)
+    return any(_normalize_if_match_tag(t) == current for t in raw.split(",") if t.strip())
+
+
 def _should_prefer_wopi_text(filename: str | None) -> bool:
     lower = str(filename or "").strip().lower()
     if "." not in lower:
@@ -2659,12 +2669,14 @@ class ItemViewSet(
     ) -> tuple[str, str, bool]:
         return _decode_text_bytes_best_effort(data, truncated=truncated)
 
-    def _text_item_head_and_etag(self, item: models.Item) -> tuple[int, str]:
+    def _text_item_head_and_etag(self, item: models.Item) -> tuple[int, str, str]:
+        """Return (content length, client-facing ETag, raw storage ETag) from one HEAD."""
         head_object = utils.get_item_file_head_object(item)
         content_length = int(head_object.get("ContentLength") or 0)
+        storage_etag = str(head_object.get("ETag") or "").strip()
         version_id = str(head_object.get("VersionId") or "").strip()
-        etag = f'"{version_id}"' if version_id else str(head_object.get("ETag") or "").strip()
-        return content_length, etag
+        etag = f'"{version_id}"' if version_id else storage_etag
+        return content_length, etag, storage_etag
 
     def _normalize_if_match_tag(self, v: str) -> str:
         return _normalize_if_match_tag(v)
@@ -2711,7 +2723,7 @@ class ItemViewSet(
         return resp
 
     def _text_put_check_existing_utf8_editable(
-        self, item: models.Item, *, content_length: int
+        self, item: models.Item, *, content_length: int, storage_etag: str
     ) -> bool:
         """
         Ensure the existing file can be safely edited as UTF-8.
@@ -2723,11 +2735,22 @@ class ItemViewSet(
             return False
 
         s3_client = default_storage.connection.meta.client
-        obj = s3_client.get_object(
-            Bucket=default_storage.bucket_name,
-            Key=item.file_key,
-            Range=f"bytes=0-{content_length - 1}",
-        )
+        get_kwargs = {
+            "Bucket": default_storage.bucket_name,
+            "Key": item.file_key,
+            "Range": f"bytes=0-{content_length - 1}",
+        }
+        if storage_etag:
+            # Check the exact version the client's If-Match was validated against.
+            get_kwargs["IfMatch"] = storage_etag
+        try:
+            obj = s3_client.get_object(**get_kwargs)
+        except ClientError as exc:
+            if get_s3_client_error_code(exc) == "PreconditionFailed":
+                raise _PreconditionFailed(
+                    "Le fichier a changé, rechargez", code="item.text.changed"
+                ) from exc
+            raise
         existing = obj["Body"].read(MAX_TEXT_PREVIEW_BYTES)
 
         if existing.startswith(b"\xff\xfe") or existing.startswith(b"\xfe\xff"):
@@ -2758,7 +2781,40 @@ class ItemViewSet(
 
         return preserve_utf8_bom
 
-    def _text_put(self, request, item: models.Item, *, content_length: int, etag: str):
+    @staticmethod
+    def _text_put_object(item: models.Item, *, payload: bytes, storage_etag: str) -> dict:
+        """
+        Write the new text bytes, conditioned on the storage ETag when there is one.
+
+        Raises _PreconditionFailed when another writer got in first.
+        """
+        s3_client = default_storage.connection.meta.client
+        put_kwargs = {
+            "Bucket": default_storage.bucket_name,
+            "Key": item.file_key,
+            "Body": payload,
+            "ContentType": str(item.mimetype or "text/plain; charset=utf-8"),
+        }
+        try:
+            # Conditional write: the store rejects the PUT if another writer got in
+            # between the HEAD above and this call.
+            return s3_client.put_object(
+                **put_kwargs, **({"IfMatch": storage_etag} if storage_etag else {})
+            )
+        except ClientError as exc:
+            code = get_s3_client_error_code(exc)
+            if code == "PreconditionFailed":
+                raise _PreconditionFailed(
+                    "Le fichier a changé, rechargez", code="item.text.changed"
+                ) from exc
+            if not storage_etag or code != "NotImplemented":
+                raise
+        # Object stores without conditional writes: keep the app-side check only.
+        return s3_client.put_object(**put_kwargs)
+
+    def _text_put(
+        self, request, item: models.Item, *, content_length: int, etag: str, storage_etag: str
+    ):
         if content_length > MAX_TEXT_PREVIEW_BYTES:
             raise drf.exceptions.ValidationError(
                 {
@@ -2801,7 +2857,7 @@ class ItemViewSet(
             )
 
         preserve_utf8_bom = self._text_put_check_existing_utf8_editable(
-            item, content_length=content_length
+            item, content_length=content_length, storage_etag=storage_etag
         )
 
         payload = content.encode("utf-8")
@@ -2816,13 +2872,7 @@ class ItemViewSet(
                 }
             )
 
-        s3_client = default_storage.connection.meta.client
-        put_response = s3_client.put_object(
-            Bucket=default_storage.bucket_name,
-            Key=item.file_key,
-            Body=payload,
-            ContentType=str(item.mimetype or "text/plain; charset=utf-8"),
-        )
+        put_response = self._text_put_object(item, payload=payload, storage_etag=storage_etag)
 
         item.size = len(payload)
         update_fields = ["size", "updated_at"]
@@ -2893,10 +2943,21 @@ class ItemViewSet(
                 }
             )
 
-        content_length, etag = self._text_item_head_and_etag(item)
+        content_length, etag, storage_etag = self._text_item_head_and_etag(item)
         if request.method == "GET":
+            # Conditional GET: the HEAD above is enough to answer an unchanged file.
+            if _if_none_match_hits(request.META.get("HTTP_IF_NONE_MATCH"), etag):
+                resp = drf.response.Response(status=drf.status.HTTP_304_NOT_MODIFIED)
+                resp["ETag"] = etag
+                return resp
             return self._text_get(item, content_length=content_length, etag=etag)
-        return self._text_put(request, item, content_length=content_length, etag=etag)
+        return self._text_put(
+            request,
+            item,
+            content_length=content_length,
+            etag=etag,
+            storage_etag=storage_etag,
+        )
 
 
 class ShareLinkViewSet(viewsets.GenericViewSet):
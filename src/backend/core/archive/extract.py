@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import mimetypes
 import os
+import shutil
 import stat
 import tarfile
 import tempfile
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from logging import getLogger
 from typing import Iterable, Literal
 
@@ -16,6 +20,7 @@ from django.core.cache import cache
 from django.core.files.base import File
 from django.core.files.storage import default_storage
 from django.db import transaction
+from django.utils import timezone
 
 from core import models
 from core.archive.fs_safe import (
@@ -26,8 +31,10 @@ from core.archive.fs_safe import (
 from core.archive.limits import (
     get_archive_extraction_limits,
     get_archive_extraction_max_archive_size,
+    get_archive_extraction_upload_workers,
 )
 from core.archive.security import UnsafeArchivePath, normalize_archive_path
+from core.storage.cache import invalidate_storage_used_cache
 
 logger = getLogger(__name__)
 
@@ -56,10 +63,23 @@ def _get_job_status(job_id: str) -> dict | None:
     return cache.get(archive_job_cache_key(job_id))
 
 
-def _put_fileobj_to_default_storage(*, storage_key: str, fileobj, mimetype: str | None) -> None:
-    """Upload a file-like object to the configured default storage."""
+def _default_storage_s3_client():
+    """Return the S3 client of the default storage for this thread, if S3-backed."""
     s3_client = getattr(getattr(default_storage, "connection", None), "meta", None)
-    s3_client = getattr(s3_client, "client", None)
+    return getattr(s3_client, "client", None)
+
+
+def _put_fileobj_to_default_storage(
+    *, storage_key: str, fileobj, mimetype: str | None, s3_client=None
+) -> None:
+    """
+    Upload a file-like object to the configured default storage.
+
+    `s3_client` lets callers uploading from worker threads reuse a client resolved
+    once on their own thread instead of building one per thread.
+    """
+    if s3_client is None:
+        s3_client = _default_storage_s3_client()
     bucket_name = getattr(default_storage, "bucket_name", None)
     if s3_client and bucket_name:
         s3_client.upload_fileobj(
@@ -83,6 +103,167 @@ def _put_fileobj_to_default_storage(*, storage_key: str, fileobj, mimetype: str
     default_storage.save(storage_key, File(fileobj))
 
 
+# Entries up to this size are spooled in memory before upload; larger ones spill to disk.
+_UPLOAD_SPOOL_MAX_MEMORY = 1024 * 1024
+
+
+def _upload_spooled_entry(*, spool, storage_key: str, mimetype: str | None, s3_client) -> None:
+    """Upload a spooled archive entry from a worker thread, then release the spool."""
+    try:
+        _put_fileobj_to_default_storage(
+            storage_key=storage_key, fileobj=spool, mimetype=mimetype, s3_client=s3_client
+        )
+    finally:
+        spool.close()
+
+
+class _ParallelEntryUploader:
+    """
+    Overlap storage uploads of extracted entries with decompression of the next ones.
+
+    Archive readers are not thread-safe, so each entry is decompressed on the
+    calling thread into a bounded spool; worker threads only perform the storage
+    upload (no database access), through one S3 client resolved on the calling
+    thread: boto3 clients are thread-safe, while django-storages would build a
+    client and connection pool per worker thread. Completed uploads are handed
+    back to `on_uploaded` on the calling thread, in submission order, so item rows
+    are only marked ready once their content is stored. The first upload error is
+    re-raised on the calling thread; uploads that had already completed are still
+    handed back, and the spools of cancelled ones are released.
+    """
+
+    def __init__(self, *, max_workers: int, on_uploaded):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="archive-extract"
+        )
+        self._max_pending = max_workers * 2
+        self._s3_client = _default_storage_s3_client()
+        self._on_uploaded = on_uploaded
+        self._pending: deque = deque()
+        self._pending_keys: set[str] = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.drain()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._abandon_pending()
+        return False
+
+    def submit(self, *, member_fp, storage_key: str, mimetype: str, context) -> None:
+        """Spool `member_fp` and schedule its upload to `storage_key`."""
+        if storage_key in self._pending_keys:
+            # Keep last-writer-wins ordering for duplicate entries targeting one key.
+            self.drain()
+        # pylint: disable-next=consider-using-with
+        spool = tempfile.SpooledTemporaryFile(max_size=_UPLOAD_SPOOL_MAX_MEMORY)
+        try:
+            shutil.copyfileobj(member_fp, spool, 1024 * 1024)
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        future = self._executor.submit(
+            _upload_spooled_entry,
+            spool=spool,
+            storage_key=storage_key,
+            mimetype=mimetype,
+            s3_client=self._s3_client,
+        )
+        self._pending.append((future, storage_key, spool, context))
+        self._pending_keys.add(storage_key)
+        while len(self._pending) >= self._max_pending:
+            self._complete_oldest()
+
+    def drain(self) -> None:
+        """Wait for all scheduled uploads and hand them back in order."""
+        while self._pending:
+            self._complete_oldest()
+
+    def _complete_oldest(self) -> None:
+        future, storage_key, _spool, context = self._pending.popleft()
+        self._pending_keys.discard(storage_key)
+        future.result()
+        self._on_uploaded(context)
+
+    def _abandon_pending(self) -> None:
+        """After a failure, keep the uploads that finished and release cancelled spools."""
+        while self._pending:
+            future, storage_key, spool, context = self._pending.popleft()
+            self._pending_keys.discard(storage_key)
+            if future.cancelled():
+                spool.close()
+            elif future.exception() is None:
+                self._on_uploaded(context)
+
+
+# Number of extracted items marked ready per UPDATE batch.
+_READY_BATCH_SIZE = 500
+
+
+def _bulk_mark_items_ready(items: list[models.Item]) -> None:
+    """
+    Persist the ready state of uploaded items in batched UPDATEs.
+
+    `bulk_update` bypasses `Item.save()` and `post_save`, so the storage-used
+    cache invalidation and the search indexer trigger are replayed on commit.
+    """
+    # Imported lazily: `core.tasks` imports this module through the archive tasks.
+    # pylint: disable-next=import-outside-toplevel
+    from core.tasks.search import trigger_batch_file_indexer  # noqa: PLC0415
+
+    now = timezone.now()
+    for item in items:
+        item.updated_at = now
+    creator_ids = list(dict.fromkeys(item.creator_id for item in items if item.creator_id))
+    with transaction.atomic():
+        models.Item.objects.bulk_update(
+            items,
+            ["upload_state", "mimetype", "size", "updated_at"],
+            batch_size=_READY_BATCH_SIZE,
+        )
+        transaction.on_commit(lambda: invalidate_storage_used_cache(creator_ids))
+        for item in items:
+            transaction.on_commit(partial(trigger_batch_file_indexer, item))
+
+
+class _ReadyItemsBatch:
+    """
+    Collect uploaded items and mark them ready in batches of `_READY_BATCH_SIZE`.
+
+    Items are keyed by pk: overwriting one file from several archive entries
+    queues several instances of the same row, and only the last one must be
+    written. Leaving the context flushes the batch, also when the job fails, so
+    items whose content was stored do not stay pending.
+    """
+
+    def __init__(self):
+        self._items: dict = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+    def add(self, item: models.Item) -> None:
+        """Queue `item` for the next batch, replacing a queued instance of the same row."""
+        self._items[item.pk] = item
+        if len(self._items) >= _READY_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Mark the queued items ready."""
+        if self._items:
+            _bulk_mark_items_ready(list(self._items.values()))
+            self._items.clear()
+
+
 def _is_tar_filename(filename: str) -> bool:
     """Return True if the filename looks like a tar (optionally compressed)."""
     lower = filename.lower()
@@ -151,31 +332,49 @@ def _filter_paths(
     return out
 
 
+def _zip_file_infos(zf: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    """
+    Return the regular file entries of a zip, skipping directories and symlinks.
+
+    Symlink entries are rejected instead when ARCHIVE_FS_STRICT is enabled.
+    """
+    strict = _archive_fs_strict()
+    # Single pass over the parsed central directory; no per-name `getinfo` lookups.
+    file_infos: list[zipfile.ZipInfo] = []
+    for info in zf.infolist():
+        if _zipinfo_is_symlink(info):
+            if strict:
+                raise ValueError("Symlink entries are not allowed.")
+            continue
+        if not info.is_dir():
+            file_infos.append(info)
+    return file_infos
+
+
 def _plan_zip(zf: zipfile.ZipFile, *, mode: ArchiveMode, selection_paths: list[str]):
     """Build a validated extraction plan for zip files."""
     limits = get_archive_extraction_limits()
-    if _archive_fs_strict() and any(_zipinfo_is_symlink(i) for i in zf.infolist()):
-        raise ValueError("Symlink entries are not allowed.")
-    all_paths = [
-        info.filename
-        for info in zf.infolist()
-        if not info.is_dir() and not _zipinfo_is_symlink(info)
-    ]
-    selected = _filter_paths(all_paths, mode=mode, selection_paths=selection_paths)
+    file_infos = _zip_file_infos(zf)
+    if mode != "all":
+        selected = set(
+            _filter_paths(
+                (info.filename for info in file_infos),
+                mode=mode,
+                selection_paths=selection_paths,
+            )
+        )
+        file_infos = [info for info in file_infos if info.filename in selected]
 
     total_files = 0
     total_bytes = 0
     normalized_paths: list[str] = []
 
-    for raw in selected:
-        n = normalize_archive_path(raw)
+    for info in file_infos:
+        n = normalize_archive_path(info.filename)
         if len(n.normalized) > limits.max_path_length:
             raise ValueError("Path too long.")
         if n.depth > limits.max_depth:
             raise ValueError("Path too deep.")
-        info = zf.getinfo(raw)
-        if _zipinfo_is_symlink(info):
-            continue
         size = int(info.file_size or 0)
         if size > limits.max_file_size:
             raise ValueError("File too large.")
@@ -411,8 +610,28 @@ def extract_archive_to_drive(  # noqa: PLR0912,PLR0913,PLR0915
                 },
             )
 
+        ready_items = _ReadyItemsBatch()
+
+        def finalize_upload(context) -> None:
+            nonlocal files_done, bytes_done
+            item, size, mimetype = context
+            item.upload_state = models.ItemUploadStateChoices.READY
+            item.mimetype = mimetype
+            item.size = size
+            ready_items.add(item)
+            files_done += 1
+            bytes_done += size
+            update_progress(plan.total_files, plan.total_bytes)
+
         if _is_zip_filename(archive_item.filename):
-            with zipfile.ZipFile(local_fp.name) as zf:
+            with (
+                zipfile.ZipFile(local_fp.name) as zf,
+                ready_items,
+                _ParallelEntryUploader(
+                    max_workers=get_archive_extraction_upload_workers(),
+                    on_uploaded=finalize_upload,
+                ) as uploads,
+            ):
                 plan = _plan_zip(zf, mode=mode, selection_paths=selection_paths)
                 update_progress(plan.total_files, plan.total_bytes)
 
@@ -424,15 +643,14 @@ def extract_archive_to_drive(  # noqa: PLR0912,PLR0913,PLR0915
                         skipped_symlinks_count += 1
                         continue
                     try:
-                        normalized = normalize_archive_path(info.filename).normalized
+                        npath = normalize_archive_path(info.filename)
                     except UnsafeArchivePath:
                         skipped_unsafe_paths_count += 1
                         continue
-                    if normalized not in normalized_set:
+                    if npath.normalized not in normalized_set:
                         continue
 
                     parent_folder = destination
-                    npath = normalize_archive_path(normalized)
                     skip_entry = False
                     for part in npath.parent_parts:
                         existing = _get_existing_child(parent=parent_folder, title=part)
@@ -486,28 +704,17 @@ def extract_archive_to_drive(  # noqa: PLR0912,PLR0913,PLR0915
                     if existing and collision_policy == "overwrite":
                         if not existing.filename:
                             raise ValueError("Existing file has no filename.")
-                        with transaction.atomic(), zf.open(info) as member_fp:
-                            _put_fileobj_to_default_storage(
+                        with zf.open(info) as member_fp:
+                            uploads.submit(
+                                member_fp=member_fp,
                                 storage_key=existing.file_key,
-                                fileobj=member_fp,
                                 mimetype=mimetype,
+                                context=(existing, int(info.file_size or 0), mimetype),
                             )
-                            existing.upload_state = models.ItemUploadStateChoices.READY
-                            existing.mimetype = mimetype
-                            existing.size = int(info.file_size or 0)
-                            existing.save(
-                                update_fields=[
-                                    "upload_state",
-                                    "mimetype",
-                                    "size",
-                                    "updated_at",
-                                ]
-                            )
-                        files_done += 1
-                        bytes_done += int(info.file_size or 0)
-                        update_progress(plan.total_files, plan.total_bytes)
                         continue
 
+                    # The row stays pending until its upload completes; rows left pending
+                    # by a failed job are reclaimed by `clean_pending_items`.
                     with transaction.atomic():
                         item = models.Item.objects.create_child(
                             creator=user,
@@ -522,23 +729,23 @@ def extract_archive_to_drive(  # noqa: PLR0912,PLR0913,PLR0915
                             item.filename = item.title
                             item.save(update_fields=["filename", "updated_at"])
 
-                        with zf.open(info) as member_fp:
-                            _put_fileobj_to_default_storage(
-                                storage_key=item.file_key,
-                                fileobj=member_fp,
-                                mimetype=mimetype,
-                            )
-
-                        item.upload_state = models.ItemUploadStateChoices.READY
-                        item.size = int(info.file_size or 0)
-                        item.save(update_fields=["upload_state", "size"])
-
-                    files_done += 1
-                    bytes_done += int(info.file_size or 0)
-                    update_progress(plan.total_files, plan.total_bytes)
+                    with zf.open(info) as member_fp:
+                        uploads.submit(
+                            member_fp=member_fp,
+                            storage_key=item.file_key,
+                            mimetype=mimetype,
+                            context=(item, int(info.file_size or 0), mimetype),
+                        )
 
         else:
-            with tarfile.open(local_fp.name, mode="r:*") as tf:
+            with (
+                tarfile.open(local_fp.name, mode="r:*") as tf,
+                ready_items,
+                _ParallelEntryUploader(
+                    max_workers=get_archive_extraction_upload_workers(),
+                    on_uploaded=finalize_upload,
+                ) as uploads,
+            ):
                 plan = _plan_tar(tf, mode=mode, selection_paths=selection_paths)
                 update_progress(plan.total_files, plan.total_bytes)
 
@@ -547,15 +754,14 @@ def extract_archive_to_drive(  # noqa: PLR0912,PLR0913,PLR0915
                     if not member.isfile():
                         continue
                     try:
-                        normalized = normalize_archive_path(member.name).normalized
+                        npath = normalize_archive_path(member.name)
                     except UnsafeArchivePath:
                         skipped_unsafe_paths_count += 1
                         continue
-                    if normalized not in normalized_set:
+                    if npath.normalized not in normalized_set:
                         continue
 
                     parent_folder = destination
-                    npath = normalize_archive_path(normalized)
                     skip_entry = False
                     for part in npath.parent_parts:
                         existing = _get_existing_child(parent=parent_folder, title=part)
@@ -621,26 +827,13 @@ def extract_archive_to_drive(  # noqa: PLR0912,PLR0913,PLR0915
                             with member_fp:
                                 pass
                             raise ValueError("Existing file has no filename.")
-                        with transaction.atomic(), member_fp:
-                            _put_fileobj_to_default_storage(
+                        with member_fp:
+                            uploads.submit(
+                                member_fp=member_fp,
                                 storage_key=existing.file_key,
-                                fileobj=member_fp,
                                 mimetype=mimetype,
+                                context=(existing, int(member.size or 0), mimetype),
                             )
-                            existing.upload_state = models.ItemUploadStateChoices.READY
-                            existing.mimetype = mimetype
-                            existing.size = int(member.size or 0)
-                            existing.save(
-                                update_fields=[
-                                    "upload_state",
-                                    "mimetype",
-                                    "size",
-                                    "updated_at",
-                                ]
-                            )
-                        files_done += 1
-                        bytes_done += int(member.size or 0)
-                        update_progress(plan.total_files, plan.total_bytes)
                         continue
 
                     with transaction.atomic():
@@ -656,20 +849,13 @@ def extract_archive_to_drive(  # noqa: PLR0912,PLR0913,PLR0915
                             item.filename = item.title
                             item.save(update_fields=["filename", "updated_at"])
 
-                        with member_fp:
-                            _put_fileobj_to_default_storage(
-                                storage_key=item.file_key,
-                                fileobj=member_fp,
-                                mimetype=mimetype,
-                            )
-
-                        item.upload_state = models.ItemUploadStateChoices.READY
-                        item.size = int(member.size or 0)
-                        item.save(update_fields=["upload_state", "size"])
-
-                    files_done += 1
-                    bytes_done += int(member.size or 0)
-                    update_progress(plan.total_files, plan.total_bytes)
+                    with member_fp:
+                        uploads.submit(
+                            member_fp=member_fp,
+                            storage_key=item.file_key,
+                            mimetype=mimetype,
+                            context=(item, int(member.size or 0), mimetype),
+                        )
 
     final = {
         "state": "done",
@@ -224,15 +224,14 @@ def extract_archive_to_mount(  # noqa: PLR0912,PLR0913,PLR0915  # pylint: disabl
                     continue
 
                 try:
-                    normalized = normalize_archive_path(info.filename).normalized
+                    npath = normalize_archive_path(info.filename)
                 except UnsafeArchivePath:
                     skipped_unsafe_paths_count += 1
                     continue
 
-                if normalized not in normalized_set:
+                if npath.normalized not in normalized_set:
                     continue
 
-                npath = normalize_archive_path(normalized)
                 rel_parent = "/".join(npath.parent_parts)
                 dest_folder = (
                     dest_normalized
@@ -61,4 +61,14 @@ def get_archive_extraction_max_archive_size() -> int:
     return _env_int("ARCHIVE_EXTRACT_MAX_ARCHIVE_SIZE", default)
 
 
+def get_archive_extraction_upload_workers() -> int:
+    """
+    Return the number of threads uploading extracted entries to storage.
+
+    Decompression stays on the task thread; only storage uploads overlap.
+    """
+
+    return max(1, _env_int("ARCHIVE_EXTRACT_WORKERS", 8))
+
+
 DEFAULT_LIMITS = get_archive_extraction_limits()
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from pathlib import PurePosixPath
+
+# Absolute POSIX paths and Windows drive-letter paths (`C:`, `C:/...`).
+_ABSOLUTE_RE = re.compile(r"^(?:/|[A-Za-z]:)")
+# A `..` component anywhere in the (slash-normalized) path.
+_TRAVERSAL_RE = re.compile(r"(?:^|/)\.\.(?:/|$)")
 
 
 class UnsafeArchivePath(ValueError):
@@ -39,7 +44,7 @@ def normalize_archive_path(path: str) -> NormalizedArchivePath:
     Normalize and validate an entry path from an archive.
 
     - Convert backslashes to slashes
-    - Reject absolute paths
+    - Reject absolute paths (including Windows drive letters)
     - Reject any `..` traversal
     - Strip leading `./`
     """
@@ -52,20 +57,13 @@ def normalize_archive_path(path: str) -> NormalizedArchivePath:
     while path.startswith("./"):
         path = path[2:]
 
-    posix = PurePosixPath(path)
-    if posix.is_absolute():
+    if _ABSOLUTE_RE.match(path):
         raise UnsafeArchivePath("Absolute paths are not allowed.")
+    if _TRAVERSAL_RE.search(path):
+        raise UnsafeArchivePath("Path traversal is not allowed.")
 
-    parts: list[str] = []
-    for part in posix.parts:
-        if part in {"", "."}:
-            continue
-        if part == "..":
-            raise UnsafeArchivePath("Path traversal is not allowed.")
-        parts.append(part)
-
+    parts = tuple(part for part in path.split("/") if part not in {"", "."})
     if not parts:
         raise UnsafeArchivePath("Invalid path.")
 
-    normalized = "/".join(parts)
-    return NormalizedArchivePath(raw=raw, normalized=normalized, parts=tuple(parts))
+    return NormalizedArchivePath(raw=raw, normalized="/".join(parts), parts=parts)
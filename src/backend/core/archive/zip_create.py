@@ -262,12 +262,13 @@ def create_zip_from_items(  # noqa: PLR0912,PLR0915  # pylint: disable=too-many-
     # If the storage is filesystem-backed, refuse/skip unsafe source paths (symlinks in components).
     safe_entries: list[tuple[models.Item, str]] = []
     skipped_unsafe_paths_count = 0
+    strict = _archive_fs_strict()
     for file_item, entry_path in entries:
         try:
             ok = _source_storage_key_is_safe_to_read(
                 storage=default_storage,
                 key=file_item.file_key,
-                strict=_archive_fs_strict(),
+                strict=strict,
             )
         except UnsafeFilesystemPath as exc:
             raise ValueError(str(exc)) from exc
@@ -13,25 +13,27 @@ class EvidenceValidationError(ValueError):
 _HASH16_RE = re.compile(r"^[0-9a-f]{16}$")
 
 
-ALLOWED_EVIDENCE_KEYS: set[str] = {
-    # Profile context (hashed)
-    "profile_id",
-    "bucket_hash",
-    "internal_endpoint_hash",
-    "external_signed_base_hash",
-    # Host / key correlation (hashed)
-    "signed_host_hash",
-    "expected_host_hash",
-    "internal_host_hash",
-    "object_key_hash",
-    # HTTP / S3 evidence (safe)
-    "status_code",
-    "request_id",
-    "attempts",
-    "strict_range_206",
-    "signed_headers_includes_x_amz_acl",
-    "signed_host_matches_internal_endpoint",
-}
+ALLOWED_EVIDENCE_KEYS: frozenset[str] = frozenset(
+    {
+        # Profile context (hashed)
+        "profile_id",
+        "bucket_hash",
+        "internal_endpoint_hash",
+        "external_signed_base_hash",
+        # Host / key correlation (hashed)
+        "signed_host_hash",
+        "expected_host_hash",
+        "internal_host_hash",
+        "object_key_hash",
+        # HTTP / S3 evidence (safe)
+        "status_code",
+        "request_id",
+        "attempts",
+        "strict_range_206",
+        "signed_headers_includes_x_amz_acl",
+        "signed_host_matches_internal_endpoint",
+    }
+)
 
 
 def build_evidence(raw: dict[str, Any]) -> dict[str, Any]:
@@ -40,8 +42,7 @@ def build_evidence(raw: dict[str, Any]) -> dict[str, Any]:
 
     This function must never echo sensitive values in exceptions.
     """
-    unknown_keys = sorted(set(raw) - ALLOWED_EVIDENCE_KEYS)
-    if unknown_keys:
+    if not ALLOWED_EVIDENCE_KEYS.issuperset(raw):
         raise EvidenceValidationError("CT-S3 evidence contains a non-allowlisted key.")
 
     out: dict[str, Any] = {}
@@ -51,7 +52,12 @@ def build_evidence(raw: dict[str, Any]) -> dict[str, Any]:
             continue
 
         if key.endswith("_hash"):
-            if not isinstance(value, str) or _HASH16_RE.fullmatch(value) is None:
+            # Length first: oversized inputs are rejected without scanning them.
+            if (
+                not isinstance(value, str)
+                or len(value) != 16
+                or _HASH16_RE.fullmatch(value) is None
+            ):
                 raise EvidenceValidationError("CT-S3 evidence hash value is not a 16-hex digest.")
             out[key] = value
             continue
@@ -80,4 +86,5 @@ def build_evidence(raw: dict[str, Any]) -> dict[str, Any]:
 
         raise EvidenceValidationError("CT-S3 evidence contains an invalid field.")
 
-    return dict(sorted(out.items(), key=lambda kv: kv[0]))
+    # Keys are unique, so sorting the items orders by key alone.
+    return dict(sorted(out.items()))
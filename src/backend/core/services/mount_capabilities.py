@@ -281,11 +281,10 @@ def normalize_mount_capabilities(raw: Any) -> dict[str, bool]:
 def resolve_enabled_mount(mount_id: str) -> dict[str, Any] | None:
     """Return the enabled mount registry entry for the given mount id."""
 
-    mounts = list(getattr(settings, "MOUNTS_REGISTRY", []) or [])
-    for mount in mounts:
-        if not bool(mount.get("enabled", True)):
-            continue
-        if mount.get("mount_id") == mount_id:
+    # Scanned per call (no id index): the registry is small and settings
+    # overrides may replace it at runtime.
+    for mount in getattr(settings, "MOUNTS_REGISTRY", None) or ():
+        if mount.get("mount_id") == mount_id and bool(mount.get("enabled", True)):
             return mount
     return None
 
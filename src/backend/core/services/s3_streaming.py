@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 
 from core.utils.no_leak import safe_str_hash
@@ -9,6 +11,92 @@ from core.utils.no_leak import safe_str_hash
 logger = getLogger(__name__)
 
 
+def _read_part(body_stream, size: int) -> bytes:
+    """
+    Read up to `size` bytes, looping over short reads until the part is full or EOF.
+
+    Socket-backed request streams may return fewer bytes than asked for; S3 rejects
+    non-final multipart parts smaller than 5 MiB, so parts must be filled.
+    """
+    chunk = body_stream.read(size)
+    if not chunk or len(chunk) >= size:
+        return chunk
+    pieces = [chunk]
+    remaining = size - len(chunk)
+    while remaining > 0:
+        chunk = body_stream.read(remaining)
+        if not chunk:
+            break
+        pieces.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(pieces)
+
+
+def _iter_parts(body_stream, chunk_size: int, first_chunk: bytes):
+    """Yield `first_chunk`, then the following parts of `body_stream` until EOF."""
+    chunk = first_chunk
+    while chunk:
+        yield chunk
+        chunk = _read_part(body_stream, chunk_size)
+
+
+def _upload_parts(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+    *,
+    s3_client,
+    bucket: str,
+    key: str,
+    upload_id: str,
+    chunks,
+    max_concurrency: int,
+) -> tuple[list[dict], int]:
+    """
+    Upload `chunks` as the parts of `upload_id`; return the parts and bytes read.
+
+    Parts are read sequentially on the calling thread; with `max_concurrency > 1`,
+    up to that many are uploaded in parallel while the next one is read, so memory
+    stays bounded to `max_concurrency + 1` chunks.
+    """
+
+    def _upload_part(part_number: int, chunk: bytes) -> dict:
+        resp = s3_client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=chunk,
+        )
+        return {"ETag": resp.get("ETag"), "PartNumber": part_number}
+
+    parts: list[dict] = []
+    bytes_written = 0
+    if max_concurrency <= 1:
+        for chunk in chunks:
+            parts.append(_upload_part(len(parts) + 1, chunk))
+            bytes_written += len(chunk)
+        return parts, bytes_written
+
+    pending: deque = deque()
+    part_number = 1
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="s3-upload-part"
+    ) as executor:
+        try:
+            for chunk in chunks:
+                while len(pending) >= max_concurrency:
+                    parts.append(pending.popleft().result())
+                pending.append(executor.submit(_upload_part, part_number, chunk))
+                bytes_written += len(chunk)
+                part_number += 1
+            while pending:
+                parts.append(pending.popleft().result())
+        except BaseException:
+            # Leaving the block waits for running parts: the caller only aborts
+            # the upload once none of them can land afterwards.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    return parts, bytes_written
+
+
 def stream_to_s3_object(  # noqa: PLR0913  # pylint: disable=too-many-arguments,too-many-locals
     *,
     s3_client,
@@ -20,17 +108,18 @@ def stream_to_s3_object(  # noqa: PLR0913  # pylint: disable=too-many-arguments,
     content_disposition: str | None = None,
     acl: str | None = None,
     chunk_size: int = 8 * 1024 * 1024,
+    max_concurrency: int = 1,
 ) -> tuple[str | None, int]:
     """
     Stream an unknown-size body into S3 using multipart upload.
 
     This avoids requiring `tell()`/`seek()` on the input stream (common for request
     bodies and StreamingBody instances).
+
+    With `max_concurrency > 1`, parts are uploaded in parallel (see `_upload_parts`).
     """
 
-    bytes_written = 0
     upload_id: str | None = None
-    parts: list[dict] = []
 
     create_kwargs = {
         "Bucket": bucket,
@@ -41,7 +130,10 @@ def stream_to_s3_object(  # noqa: PLR0913  # pylint: disable=too-many-arguments,
         **({"ACL": acl} if acl else {}),
     }
 
-    if body_stream is None:
+    # Read the first part before creating the multipart upload: an empty body is
+    # stored with one simple put instead of create/complete round-trips.
+    first_chunk = _read_part(body_stream, chunk_size) if body_stream is not None else b""
+    if not first_chunk:
         put_resp = s3_client.put_object(**{**create_kwargs, "Body": b""})
         return (put_resp.get("VersionId"), 0)
 
@@ -51,35 +143,14 @@ def stream_to_s3_object(  # noqa: PLR0913  # pylint: disable=too-many-arguments,
         if not upload_id:
             raise RuntimeError("missing_upload_id")
 
-        part_number = 1
-        while True:
-            chunk = body_stream.read(chunk_size)
-            if not chunk:
-                break
-            resp = s3_client.upload_part(
-                Bucket=bucket,
-                Key=key,
-                UploadId=upload_id,
-                PartNumber=part_number,
-                Body=chunk,
-            )
-            parts.append({"ETag": resp.get("ETag"), "PartNumber": part_number})
-            bytes_written += len(chunk)
-            part_number += 1
-
-        if not parts:
-            # Empty body: fall back to a simple put.
-            put_kwargs = {
-                "Bucket": bucket,
-                "Key": key,
-                "Body": b"",
-                "ContentType": str(content_type or "application/octet-stream"),
-                **({"Metadata": metadata} if isinstance(metadata, dict) else {}),
-                **({"ContentDisposition": content_disposition} if content_disposition else {}),
-                **({"ACL": acl} if acl else {}),
-            }
-            put_resp = s3_client.put_object(**put_kwargs)
-            return (put_resp.get("VersionId"), 0)
+        parts, bytes_written = _upload_parts(
+            s3_client=s3_client,
+            bucket=bucket,
+            key=key,
+            upload_id=upload_id,
+            chunks=_iter_parts(body_stream, chunk_size, first_chunk),
+            max_concurrency=max_concurrency,
+        )
 
         complete_resp = s3_client.complete_multipart_upload(
             Bucket=bucket,
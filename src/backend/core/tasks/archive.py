@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import random
 from logging import getLogger
+from typing import Callable
+
+from django.conf import settings
 
 from core.archive.extract import (
     extract_archive_to_drive,
@@ -24,72 +28,112 @@ from drive.celery_app import app
 
 logger = getLogger(__name__)
 
+# Share of failures logged with a full traceback outside DEBUG. Celery already
+# logs the re-raised exception, so the wrapper only needs a structured record.
+FAILURE_TRACEBACK_SAMPLE_RATE = 0.01
+
+
+def log_job_failure(event: str, *, job_id: str, exc: BaseException) -> None:
+    """Emit one structured record for a failed archive job."""
+    if settings.DEBUG or random.random() < FAILURE_TRACEBACK_SAMPLE_RATE:  # noqa: S311
+        logger.exception("%s: failed (job_id=%s)", event, job_id)
+        return
+    logger.error(
+        "%s: failed (job_id=%s exc_type=%s)",
+        event,
+        job_id,
+        type(exc).__name__,
+        extra={"job_id": job_id, "exc_type": type(exc).__name__, "exc": str(exc)},
+    )
 
-@app.task(bind=True, name="core.archive.extract_archive_to_drive")
-def extract_archive_to_drive_task(self, **kwargs):
-    """Celery task wrapper to run `extract_archive_to_drive` and persist status on failure."""
 
-    kwargs = dict(kwargs)
-    job_id = kwargs.pop("job_id", None) or self.request.id
+def mark_job_failed(  # pylint: disable=too-many-arguments
+    *,
+    job_id: str,
+    user_id: str,
+    exc: BaseException,
+    get_status: Callable[[str], dict],
+    set_status: Callable[[str, dict], None],
+) -> None:
+    """
+    Persist a best-effort `failed` status for a job.
+
+    Never raises: the caller re-raises the original task exception, which must
+    not be masked by a cache outage while persisting the status.
+    """
     try:
-        return extract_archive_to_drive(job_id=job_id, **kwargs)  # pylint: disable=missing-kwoa
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        status = get_archive_extraction_job_status(job_id)
-        if "user_id" not in status and "user_id" in kwargs:
-            status["user_id"] = kwargs["user_id"]
+        status = dict(get_status(job_id) or {})
+        status.setdefault("user_id", user_id)
         status.update(
             {
                 "state": "failed",
                 "errors": [{"detail": str(exc)}],
             }
         )
+        set_status(job_id, status)
+    except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+        logger.warning("archive_task: could not persist failed status (job_id=%s)", job_id)
+
+
+@app.task(bind=True, name="core.archive.extract_archive_to_drive", typing=True)
+def extract_archive_to_drive_task(self, *, user_id: str, job_id: str | None = None, **kwargs):
+    """Celery task wrapper to run `extract_archive_to_drive` and persist status on failure."""
+
+    job_id = job_id or self.request.id
+    try:
+        return extract_archive_to_drive(  # pylint: disable=missing-kwoa
+            job_id=job_id, user_id=user_id, **kwargs
+        )
+    except Exception as exc:  # pylint: disable=broad-exception-caught
         # Keep a best-effort status for the UI.
-        set_archive_extraction_job_status(job_id, status)
-        logger.exception("archive_extract: failed (job_id=%s)", job_id)
+        mark_job_failed(
+            job_id=job_id,
+            user_id=user_id,
+            exc=exc,
+            get_status=get_archive_extraction_job_status,
+            set_status=set_archive_extraction_job_status,
+        )
+        log_job_failure("archive_extract", job_id=job_id, exc=exc)
         raise
 
 
-@app.task(bind=True, name="core.archive.extract_archive_to_mount")
-def extract_archive_to_mount_task(self, **kwargs):
+@app.task(bind=True, name="core.archive.extract_archive_to_mount", typing=True)
+def extract_archive_to_mount_task(self, *, user_id: str, job_id: str | None = None, **kwargs):
     """Celery task wrapper to run `extract_archive_to_mount` and persist status on failure."""
 
-    kwargs = dict(kwargs)
-    job_id = kwargs.pop("job_id", None) or self.request.id
+    job_id = job_id or self.request.id
     try:
-        return extract_archive_to_mount(job_id=job_id, **kwargs)  # pylint: disable=missing-kwoa
+        return extract_archive_to_mount(  # pylint: disable=missing-kwoa
+            job_id=job_id, user_id=user_id, **kwargs
+        )
     except Exception as exc:  # pylint: disable=broad-exception-caught
-        status = get_mount_archive_extraction_job_status(job_id)
-        if "user_id" not in status and "user_id" in kwargs:
-            status["user_id"] = kwargs["user_id"]
-        status.update(
-            {
-                "state": "failed",
-                "errors": [{"detail": str(exc)}],
-            }
+        mark_job_failed(
+            job_id=job_id,
+            user_id=user_id,
+            exc=exc,
+            get_status=get_mount_archive_extraction_job_status,
+            set_status=set_mount_archive_extraction_job_status,
         )
-        set_mount_archive_extraction_job_status(job_id, status)
-        logger.exception("mount_archive_extract: failed (job_id=%s)", job_id)
+        log_job_failure("mount_archive_extract", job_id=job_id, exc=exc)
         raise
 
 
-@app.task(bind=True, name="core.archive.create_zip_from_items")
-def create_zip_from_items_task(self, **kwargs):
+@app.task(bind=True, name="core.archive.create_zip_from_items", typing=True)
+def create_zip_from_items_task(self, *, user_id: str, job_id: str | None = None, **kwargs):
     """Celery task wrapper to run `create_zip_from_items` and persist status on failure."""
 
-    kwargs = dict(kwargs)
-    job_id = kwargs.pop("job_id", None) or self.request.id
+    job_id = job_id or self.request.id
     try:
-        return create_zip_from_items(job_id=job_id, **kwargs)  # pylint: disable=missing-kwoa
+        return create_zip_from_items(  # pylint: disable=missing-kwoa
+            job_id=job_id, user_id=user_id, **kwargs
+        )
     except Exception as exc:  # pylint: disable=broad-exception-caught
-        status = get_archive_zip_job_status(job_id)
-        if "user_id" not in status and "user_id" in kwargs:
-            status["user_id"] = kwargs["user_id"]
-        status.update(
-            {
-                "state": "failed",
-                "errors": [{"detail": str(exc)}],
-            }
+        mark_job_failed(
+            job_id=job_id,
+            user_id=user_id,
+            exc=exc,
+            get_status=get_archive_zip_job_status,
+            set_status=set_archive_zip_job_status,
         )
-        set_archive_zip_job_status(job_id, status)
-        logger.exception("archive_zip: failed (job_id=%s)", job_id)
+        log_job_failure("archive_zip", job_id=job_id, exc=exc)
         raise
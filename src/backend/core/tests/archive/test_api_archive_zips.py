@@ -8,18 +8,74 @@ from uuid import uuid4
 from zipfile import ZipFile
 
 from django.core.files.storage import default_storage
+from django.db import transaction
 
 import pytest
-from lasuite.drf.models.choices import RoleChoices
+from lasuite.drf.models.choices import LinkReachChoices, RoleChoices
 from rest_framework.test import APIClient
 
 from core import factories, models
+from core.tests.utils.items import make_file_item
 
 pytestmark = pytest.mark.django_db
 
 
+@pytest.fixture(name="user")
+def fixture_user():
+    """Owner of the destination folder."""
+    return factories.UserFactory()
+
+
+@pytest.fixture(name="destination")
+def fixture_destination(user):
+    """Folder owned by `user` that receives the archive job output."""
+    return factories.ItemFactory(
+        creator=user,
+        type=models.ItemTypeChoices.FOLDER,
+        users=[(user, RoleChoices.OWNER)],
+    )
+
+
+@pytest.fixture(name="shared_api_client", scope="module")
+def fixture_shared_api_client():
+    """API client built once per module; authentication is set per test."""
+    return APIClient()
+
+
+@pytest.fixture(name="api_client")
+def fixture_api_client(shared_api_client, user):
+    """API client authenticated as `user`, reset after the test."""
+    shared_api_client.force_authenticate(user)
+    yield shared_api_client
+    shared_api_client.force_authenticate(user=None)
+    shared_api_client.cookies.clear()
+
+
+def _tree_item(parent, **kwargs):
+    """Build an unsaved item placed under `parent`, ready for `bulk_create`."""
+    item = models.Item(link_reach=LinkReachChoices.RESTRICTED, **kwargs)
+    item.path = f"{parent.path!s}.{item.id!s}"
+    return item
+
+
+def _tree_file(parent, *, creator, title, content):
+    """Build an unsaved ready file item; `bulk_create` bypasses `Item.save()`."""
+    return _tree_item(
+        parent,
+        creator=creator,
+        type=models.ItemTypeChoices.FILE,
+        title=title,
+        filename=title,
+        mimetype="text/plain",
+        upload_state=models.ItemUploadStateChoices.READY,
+        size=len(content),
+    )
+
+
 @mock.patch("core.api.views_archive_zip.get_entitlements_backend")
-def test_api_archive_zips_entitlement_reason_denies_upload(mock_get_entitlements_backend):
+def test_api_archive_zips_entitlement_reason_denies_upload(
+    mock_get_entitlements_backend, api_client
+):
     """Archive creation should not expose an entitlement reason as a message."""
     mock_entitlement_backend = mock.Mock()
     mock_entitlement_backend.can_upload.return_value = {
@@ -28,11 +84,7 @@ def test_api_archive_zips_entitlement_reason_denies_upload(mock_get_entitlements
     }
     mock_get_entitlements_backend.return_value = mock_entitlement_backend
 
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_authenticate(user)
-
-    response = client.post(
+    response = api_client.post(
         "/api/v1.0/archive-zips/",
         {
             "item_ids": [str(uuid4())],
@@ -46,31 +98,18 @@ def test_api_archive_zips_entitlement_reason_denies_upload(mock_get_entitlements
     assert response.json()["errors"][0]["detail"] == "Upload not allowed."
 
 
-def test_api_archive_zips_single_file_ok():
+def test_api_archive_zips_single_file_ok(user, destination, api_client):
     """Zipping a single file creates a .zip in the destination folder."""
 
-    user = factories.UserFactory()
-    destination = factories.ItemFactory(
-        creator=user,
-        type=models.ItemTypeChoices.FOLDER,
-        users=[(user, RoleChoices.OWNER)],
-    )
-
-    file_item = factories.ItemFactory(
+    file_item = make_file_item(
         creator=user,
         parent=destination,
-        type=models.ItemTypeChoices.FILE,
         title="hello.txt",
+        content=b"hello",
         mimetype="text/plain",
-        update_upload_state=models.ItemUploadStateChoices.READY,
-        upload_bytes=b"hello",
-        upload_bytes__filename="hello.txt",
     )
 
-    client = APIClient()
-    client.force_authenticate(user)
-
-    response = client.post(
+    response = api_client.post(
         "/api/v1.0/archive-zips/",
         {
             "item_ids": [str(file_item.id)],
@@ -82,7 +121,7 @@ def test_api_archive_zips_single_file_ok():
     assert response.status_code == 201
     job_id = response.json()["job_id"]
 
-    status_response = client.get(f"/api/v1.0/archive-zips/{job_id}/")
+    status_response = api_client.get(f"/api/v1.0/archive-zips/{job_id}/")
     assert status_response.status_code == 200
     payload = status_response.json()
     assert payload["state"] == "done"
@@ -99,56 +138,22 @@ def test_api_archive_zips_single_file_ok():
         assert zf.read("hello.txt") == b"hello"
 
 
-def test_api_archive_zips_folder_ok():
+def test_api_archive_zips_folder_ok(user, destination, api_client):
     """Zipping a folder includes files under a folder prefix."""
 
-    user = factories.UserFactory()
-    destination = factories.ItemFactory(
-        creator=user,
-        type=models.ItemTypeChoices.FOLDER,
-        users=[(user, RoleChoices.OWNER)],
+    # The tree layout is known upfront: compute the ltree paths and insert it at once.
+    folder = _tree_item(
+        destination, creator=user, type=models.ItemTypeChoices.FOLDER, title="MyFolder"
     )
-
-    folder = factories.ItemFactory(
-        creator=user,
-        parent=destination,
-        type=models.ItemTypeChoices.FOLDER,
-        title="MyFolder",
-        users=[(user, RoleChoices.OWNER)],
-    )
-    factories.ItemFactory(
-        creator=user,
-        parent=folder,
-        type=models.ItemTypeChoices.FILE,
-        title="a.txt",
-        mimetype="text/plain",
-        update_upload_state=models.ItemUploadStateChoices.READY,
-        upload_bytes=b"a",
-        upload_bytes__filename="a.txt",
-    )
-
-    subfolder = factories.ItemFactory(
-        creator=user,
-        parent=folder,
-        type=models.ItemTypeChoices.FOLDER,
-        title="Sub",
-        users=[(user, RoleChoices.OWNER)],
-    )
-    factories.ItemFactory(
-        creator=user,
-        parent=subfolder,
-        type=models.ItemTypeChoices.FILE,
-        title="b.txt",
-        mimetype="text/plain",
-        update_upload_state=models.ItemUploadStateChoices.READY,
-        upload_bytes=b"b",
-        upload_bytes__filename="b.txt",
-    )
-
-    client = APIClient()
-    client.force_authenticate(user)
-
-    response = client.post(
+    subfolder = _tree_item(folder, creator=user, type=models.ItemTypeChoices.FOLDER, title="Sub")
+    file_a = _tree_file(folder, creator=user, title="a.txt", content=b"a")
+    file_b = _tree_file(subfolder, creator=user, title="b.txt", content=b"b")
+    with transaction.atomic():
+        models.Item.objects.bulk_create([folder, subfolder, file_a, file_b])
+    default_storage.save(file_a.file_key, BytesIO(b"a"))
+    default_storage.save(file_b.file_key, BytesIO(b"b"))
+
+    response = api_client.post(
         "/api/v1.0/archive-zips/",
         {
             "item_ids": [str(folder.id)],
@@ -160,7 +165,7 @@ def test_api_archive_zips_folder_ok():
     assert response.status_code == 201
     job_id = response.json()["job_id"]
 
-    status_response = client.get(f"/api/v1.0/archive-zips/{job_id}/")
+    status_response = api_client.get(f"/api/v1.0/archive-zips/{job_id}/")
     assert status_response.status_code == 200
     payload = status_response.json()
     assert payload["state"] == "done"
@@ -14,6 +14,7 @@ from core.archive.limits import (
     get_archive_extraction_max_archive_size,
 )
 from core.archive.security import UnsafeArchivePath, normalize_archive_path
+from core.tests.utils.archives import make_zip_bytes
 
 
 def test_normalize_archive_path_normalizes_and_exposes_parts():
@@ -27,7 +28,9 @@ def test_normalize_archive_path_normalizes_and_exposes_parts():
     assert normalized.parent_parts == ("folder", "child")
 
 
-@pytest.mark.parametrize("raw", ["", "/etc/passwd", "../secret.txt", "././"])
+@pytest.mark.parametrize(
+    "raw", ["", "/etc/passwd", "../secret.txt", "a/../b", "././", "C:/evil.txt", "c:evil.txt"]
+)
 def test_normalize_archive_path_rejects_unsafe_inputs(raw):
     with pytest.raises(UnsafeArchivePath):
         normalize_archive_path(raw)
@@ -76,7 +79,9 @@ def test_get_archive_extraction_limits_and_max_archive_size_support_overrides(mo
 
 def test_plan_zip_filters_and_normalizes_selection():
     buffer = BytesIO()
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+    with zipfile.ZipFile(
+        buffer, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+    ) as archive:
         archive.writestr("folder/a.txt", b"a")
         archive.writestr("folder/sub/b.txt", b"bb")
         archive.writestr("elsewhere.txt", b"x")
@@ -93,9 +98,17 @@ def test_plan_zip_filters_and_normalizes_selection():
     assert plan.total_bytes == 3
 
 
+def test_plan_zip_rejects_zip_slip_entries():
+    zip_bytes = make_zip_bytes({"ok.txt": b"ok", "../evil.txt": b"nope"})
+
+    with zipfile.ZipFile(BytesIO(zip_bytes)) as archive:
+        with pytest.raises(UnsafeArchivePath, match="Path traversal is not allowed."):
+            _plan_zip(archive, mode="all", selection_paths=[])
+
+
 def test_plan_tar_filters_and_normalizes_selection():
     buffer = BytesIO()
-    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+    with tarfile.open(fileobj=buffer, mode="w:gz", compresslevel=1) as archive:
         data = b"hello"
         info = tarfile.TarInfo("root/hello.txt")
         info.size = len(data)
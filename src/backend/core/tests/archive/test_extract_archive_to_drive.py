@@ -0,0 +1,289 @@
+"""
+Tests for `extract_archive_to_drive`, called in-process.
+
+The HTTP contract (job creation, status polling, permissions) is covered by
+`test_api_archive_extractions.py`; these tests only exercise extraction behavior.
+"""
+
+import zipfile
+from io import BytesIO
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+from lasuite.drf.models.choices import RoleChoices
+
+from core import factories, models
+from core.archive import extract as extract_module
+from core.archive.extract import extract_archive_to_drive
+from core.tests.utils.archives import (
+    make_zip_bytes,
+    make_zip_with_symlink_entry,
+    read_storage_key,
+)
+from core.tests.utils.items import make_file_item
+
+pytestmark = pytest.mark.django_db
+
+# Zip bytes are immutable: build the fixtures shared by several tests once.
+_ZIP_ROOT_TXT_NEW = make_zip_bytes({"root.txt": b"new"})
+_SYMLINK_ZIP_BYTES = make_zip_with_symlink_entry()
+
+
+@pytest.fixture(name="user")
+def fixture_user():
+    """Owner of the destination folder."""
+    return factories.UserFactory()
+
+
+@pytest.fixture(name="destination")
+def fixture_destination(user):
+    """Folder owned by `user` that receives the extracted items."""
+    return factories.ItemFactory(
+        creator=user,
+        type=models.ItemTypeChoices.FOLDER,
+        users=[(user, RoleChoices.OWNER)],
+    )
+
+
+def _extract(*, user, destination, zip_bytes, title, **kwargs):
+    """Store `zip_bytes` as an archive item in `destination` and extract it there."""
+    archive = make_file_item(
+        creator=user,
+        parent=destination,
+        title=title,
+        content=zip_bytes,
+        mimetype="application/zip",
+    )
+    result = extract_archive_to_drive(
+        job_id=str(uuid4()),
+        archive_item_id=str(archive.id),
+        destination_folder_id=str(destination.id),
+        user_id=str(user.id),
+        mode="all",
+        selection_paths=[],
+        **kwargs,
+    )
+    return archive, result
+
+
+def _extracted_files(destination, archive):
+    """
+    Return extracted file items, excluding the archive itself.
+
+    Archives in this module are flat, so only direct children are queried.
+    """
+    return list(
+        models.Item.objects.children(destination.path)
+        .exclude(id=archive.id)
+        .filter(type=models.ItemTypeChoices.FILE)
+    )
+
+
+def test_extract_archive_to_drive_zip_symlink_is_ignored(user, destination):
+    """Symlink entries in zip archives are ignored (never created server-side)."""
+    archive, result = _extract(
+        user=user, destination=destination, zip_bytes=_SYMLINK_ZIP_BYTES, title="symlink.zip"
+    )
+
+    assert result["state"] == "done"
+    assert result["progress"]["files_done"] == 1
+    assert result["skipped_symlinks_count"] == 1
+
+    extracted_files = _extracted_files(destination, archive)
+    assert len(extracted_files) == 1
+    assert extracted_files[0].filename == "ok.txt"
+    assert extracted_files[0].upload_state == models.ItemUploadStateChoices.READY
+    assert read_storage_key(extracted_files[0].file_key) == b"ok"
+
+
+def test_extract_archive_to_drive_zip_symlink_strict_fails(monkeypatch, user, destination):
+    """When ARCHIVE_FS_STRICT is enabled, symlink entries make the job fail closed."""
+    monkeypatch.setenv("ARCHIVE_FS_STRICT", "1")
+
+    with pytest.raises(ValueError, match="Symlink entries are not allowed."):
+        _extract(
+            user=user, destination=destination, zip_bytes=_SYMLINK_ZIP_BYTES, title="symlink.zip"
+        )
+
+
+def test_extract_archive_to_drive_collision_skip(user, destination):
+    """When collision_policy=skip, existing files are preserved and no new file is created."""
+    existing = make_file_item(
+        creator=user,
+        parent=destination,
+        title="root.txt",
+        content=b"old",
+        mimetype="text/plain",
+    )
+
+    archive, result = _extract(
+        user=user,
+        destination=destination,
+        zip_bytes=_ZIP_ROOT_TXT_NEW,
+        title="skip.zip",
+        collision_policy="skip",
+    )
+
+    assert result["state"] == "done"
+    assert {i.id for i in _extracted_files(destination, archive)} == {existing.id}
+    assert read_storage_key(existing.file_key) == b"old"
+
+
+def test_extract_archive_to_drive_collision_overwrite(user, destination):
+    """When collision_policy=overwrite, existing files are overwritten in place."""
+    existing = make_file_item(
+        creator=user,
+        parent=destination,
+        title="root.txt",
+        content=b"old",
+        mimetype="text/plain",
+    )
+
+    archive, result = _extract(
+        user=user,
+        destination=destination,
+        zip_bytes=_ZIP_ROOT_TXT_NEW,
+        title="overwrite.zip",
+        collision_policy="overwrite",
+    )
+
+    assert result["state"] == "done"
+    assert {i.id for i in _extracted_files(destination, archive)} == {existing.id}
+    assert read_storage_key(existing.file_key) == b"new"
+
+
+def test_extract_archive_to_drive_collision_overwrite_duplicate_entries(user, destination):
+    """Duplicate entries for one path overwrite each other: the last one is kept."""
+    buf = BytesIO()
+    with (
+        pytest.warns(UserWarning, match="Duplicate name"),
+        zipfile.ZipFile(buf, mode="w") as zf,
+    ):
+        zf.writestr("dup.txt", b"first version")
+        zf.writestr("dup.txt", b"v2")
+
+    archive, result = _extract(
+        user=user,
+        destination=destination,
+        zip_bytes=buf.getvalue(),
+        title="duplicates.zip",
+        collision_policy="overwrite",
+    )
+
+    assert result["state"] == "done"
+    assert result["progress"]["files_done"] == 2
+    extracted_files = _extracted_files(destination, archive)
+    assert len(extracted_files) == 1
+    assert extracted_files[0].upload_state == models.ItemUploadStateChoices.READY
+    assert extracted_files[0].size == 2
+    assert read_storage_key(extracted_files[0].file_key) == b"v2"
+
+
+def test_extract_archive_to_drive_failure_keeps_stored_entries_ready(user, destination):
+    """Entries stored before an upload failure are still marked ready."""
+    real_put = extract_module._put_fileobj_to_default_storage
+
+    def put_or_fail(*, storage_key, fileobj, **kwargs):
+        if fileobj.read() == b"boom":
+            raise OSError("storage down")
+        fileobj.seek(0)
+        real_put(storage_key=storage_key, fileobj=fileobj, **kwargs)
+
+    with (
+        mock.patch.object(extract_module, "_put_fileobj_to_default_storage", put_or_fail),
+        pytest.raises(OSError, match="storage down"),
+    ):
+        _extract(
+            user=user,
+            destination=destination,
+            zip_bytes=make_zip_bytes({"a.txt": b"ok", "b.txt": b"boom"}),
+            title="partial.zip",
+        )
+
+    states = dict(
+        models.Item.objects.children(destination.path)
+        .filter(type=models.ItemTypeChoices.FILE, title__in=["a.txt", "b.txt"])
+        .values_list("title", "upload_state")
+    )
+    assert states == {
+        "a.txt": models.ItemUploadStateChoices.READY,
+        "b.txt": models.ItemUploadStateChoices.PENDING,
+    }
+
+
+def test_extract_archive_to_drive_create_root_folder_default_name(user, destination):
+    """Root-folder extraction uses a folder named after the archive."""
+    _, result = _extract(
+        user=user,
+        destination=destination,
+        zip_bytes=make_zip_bytes({"root.txt": b"root"}),
+        title="archiveA.zip",
+        create_root_folder=True,
+    )
+
+    assert result["state"] == "done"
+
+    created_folder = (
+        models.Item.objects.children(destination.path)
+        .filter(
+            type=models.ItemTypeChoices.FOLDER,
+            title="archiveA",
+            deleted_at__isnull=True,
+            hard_deleted_at__isnull=True,
+            ancestors_deleted_at__isnull=True,
+        )
+        .first()
+    )
+    assert created_folder is not None
+
+    extracted = (
+        models.Item.objects.children(created_folder.path)
+        .filter(type=models.ItemTypeChoices.FILE, filename="root.txt")
+        .first()
+    )
+    assert extracted is not None
+    assert read_storage_key(extracted.file_key) == b"root"
+
+
+def test_extract_archive_to_drive_limits_max_files(monkeypatch, user, destination):
+    """Extraction fails when max files limit is exceeded."""
+    monkeypatch.setenv("ARCHIVE_EXTRACT_MAX_FILES", "1")
+
+    with pytest.raises(ValueError, match="Too many files."):
+        _extract(
+            user=user,
+            destination=destination,
+            zip_bytes=make_zip_bytes({"a.txt": b"a", "b.txt": b"b"}),
+            title="too_many.zip",
+        )
+
+
+def test_extract_archive_to_drive_limits_max_total_size(monkeypatch, user, destination):
+    """Extraction fails when max total uncompressed size limit is exceeded."""
+    monkeypatch.setenv("ARCHIVE_EXTRACT_MAX_TOTAL_SIZE", "3")
+    # The archive blob cap defaults to the total size limit: lift it so the
+    # uncompressed total is what trips.
+    monkeypatch.setenv("ARCHIVE_EXTRACT_MAX_ARCHIVE_SIZE", str(1024**2))
+
+    with pytest.raises(ValueError, match=r"^Archive too large to extract\.$"):
+        _extract(
+            user=user,
+            destination=destination,
+            zip_bytes=make_zip_bytes({"a.txt": b"aa", "b.txt": b"bb"}),
+            title="too_big.zip",
+        )
+
+
+def test_extract_archive_to_drive_limits_compression_ratio(monkeypatch, user, destination):
+    """Extraction fails when compression ratio looks suspicious."""
+    monkeypatch.setenv("ARCHIVE_EXTRACT_MAX_COMPRESSION_RATIO", "5")
+
+    # Highly compressible payload: should exceed ratio limit when env is low.
+    with pytest.raises(ValueError, match="Suspicious compression ratio."):
+        _extract(
+            user=user,
+            destination=destination,
+            zip_bytes=make_zip_bytes({"bomb.txt": b"0" * 4096}, compression=zipfile.ZIP_DEFLATED),
+            title="ratio.zip",
+        )
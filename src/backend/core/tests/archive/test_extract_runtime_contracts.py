@@ -1,13 +1,20 @@
 """Direct tests for archive extraction runtime helper contracts."""
 # pylint: disable=missing-function-docstring,missing-class-docstring
 
+import io
+import tempfile
+import threading
 from types import SimpleNamespace
+from unittest import mock
 
 from django.core.cache import cache
 
+import pytest
+
 from core import models
 from core.archive.extract import (
     _default_root_folder_title,
+    _ParallelEntryUploader,
     archive_job_cache_key,
     get_archive_extraction_job_status,
     is_supported_archive_for_server_extraction,
@@ -94,3 +101,118 @@ def test_default_root_folder_title_strips_zip_suffix_and_sanitizes_segments():
     archive_item = SimpleNamespace(title=" My/Archive.zip ", filename="ignored.zip")
 
     assert _default_root_folder_title(archive_item) == "My_Archive"
+
+
+def test_parallel_entry_uploader_hands_back_uploads_in_submission_order():
+    uploaded = {}
+    done = []
+
+    def fake_put(*, storage_key, fileobj, mimetype, **_kwargs):
+        uploaded[storage_key] = (fileobj.read(), mimetype)
+
+    with (
+        mock.patch("core.archive.extract._put_fileobj_to_default_storage", side_effect=fake_put),
+        _ParallelEntryUploader(max_workers=2, on_uploaded=done.append) as uploads,
+    ):
+        for index in range(5):
+            uploads.submit(
+                member_fp=io.BytesIO(f"content-{index}".encode()),
+                storage_key=f"key-{index}",
+                mimetype="text/plain",
+                context=index,
+            )
+
+    assert done == [0, 1, 2, 3, 4]
+    assert uploaded["key-3"] == (b"content-3", "text/plain")
+
+
+def test_parallel_entry_uploader_shares_the_calling_thread_s3_client():
+    # Resolved once on the calling thread: a second lookup would exhaust side_effect.
+    client = mock.Mock()
+
+    with (
+        mock.patch("core.archive.extract._default_storage_s3_client", side_effect=[client]),
+        mock.patch("core.archive.extract.default_storage", SimpleNamespace(bucket_name="b")),
+        _ParallelEntryUploader(max_workers=2, on_uploaded=lambda _context: None) as uploads,
+    ):
+        for index in range(3):
+            uploads.submit(
+                member_fp=io.BytesIO(b"data"),
+                storage_key=f"key-{index}",
+                mimetype="text/plain",
+                context=index,
+            )
+
+    assert sorted(call.args[2] for call in client.upload_fileobj.call_args_list) == [
+        "key-0",
+        "key-1",
+        "key-2",
+    ]
+
+
+def test_parallel_entry_uploader_reraises_first_upload_error():
+    done = []
+
+    with (
+        mock.patch(
+            "core.archive.extract._put_fileobj_to_default_storage",
+            side_effect=OSError("storage down"),
+        ),
+        pytest.raises(OSError, match="storage down"),
+        _ParallelEntryUploader(max_workers=1, on_uploaded=done.append) as uploads,
+    ):
+        uploads.submit(
+            member_fp=io.BytesIO(b"data"),
+            storage_key="key",
+            mimetype="text/plain",
+            context="entry",
+        )
+
+    assert not done
+
+
+def test_parallel_entry_uploader_on_error_keeps_finished_uploads_and_closes_cancelled_spools():
+    done = []
+    spools = []
+    started = threading.Barrier(3, timeout=10)
+    release = threading.Event()
+    real_spooled_temporary_file = tempfile.SpooledTemporaryFile
+
+    def track_spool(**kwargs):
+        spools.append(real_spooled_temporary_file(**kwargs))
+        return spools[-1]
+
+    def blocking_put(*, storage_key, **_kwargs):
+        started.wait()
+        assert release.wait(timeout=10), storage_key
+
+    with (
+        mock.patch(
+            "core.archive.extract._put_fileobj_to_default_storage", side_effect=blocking_put
+        ),
+        mock.patch("core.archive.extract.tempfile.SpooledTemporaryFile", side_effect=track_spool),
+        pytest.raises(RuntimeError, match="extraction failed"),
+        _ParallelEntryUploader(max_workers=2, on_uploaded=done.append) as uploads,
+    ):
+        # Both workers block, so the third upload is still queued when the job fails.
+        for key in ("running-a", "running-b", "queued"):
+            uploads.submit(
+                member_fp=io.BytesIO(b"data"),
+                storage_key=key,
+                mimetype="text/plain",
+                context=key,
+            )
+        started.wait()
+        real_shutdown = uploads._executor.shutdown
+
+        def shutdown_then_release(*, wait, cancel_futures):
+            real_shutdown(wait=False, cancel_futures=cancel_futures)
+            release.set()
+            real_shutdown(wait=wait)
+
+        uploads._executor.shutdown = shutdown_then_release
+        raise RuntimeError("extraction failed")
+
+    assert done == ["running-a", "running-b"]
+    assert len(spools) == 3
+    assert all(spool.closed for spool in spools)
@@ -3,7 +3,11 @@ Tests for filesystem-safe storage helpers (symlink no-follow).
 """
 
 import os
+import shutil
+import tempfile
 from io import BytesIO
+from pathlib import Path
+from uuid import uuid4
 
 from django.core.files.storage import FileSystemStorage
 
@@ -19,12 +23,33 @@ from core.archive.fs_safe import (
 
 pytestmark = pytest.mark.django_db
 
+_SHM = Path("/dev/shm")
 
-def test_fs_safe_write_refuses_symlink_component(tmp_path):
+
+@pytest.fixture(name="fs_base", scope="session")
+def fixture_fs_base(tmp_path_factory):
+    """Session directory on tmpfs when available, falling back to pytest's tmp dir."""
+    if _SHM.is_dir() and os.access(_SHM, os.W_OK | os.X_OK):
+        base = Path(tempfile.mkdtemp(prefix="drive-fs-safe-", dir=_SHM))
+        yield base
+        shutil.rmtree(base, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("fs-safe")
+
+
+@pytest.fixture(name="fs_root")
+def fixture_fs_root(fs_base):
+    """Fresh per-test directory under `fs_base`."""
+    path = fs_base / uuid4().hex
+    path.mkdir()
+    return path
+
+
+def test_fs_safe_write_refuses_symlink_component(fs_root):
     """Writing through a pre-existing symlink component must be refused."""
 
-    root = tmp_path / "root"
-    outside = tmp_path / "outside"
+    root = fs_root / "root"
+    outside = fs_root / "outside"
     root.mkdir()
     outside.mkdir()
 
@@ -41,11 +66,11 @@ def test_fs_safe_write_refuses_symlink_component(tmp_path):
     assert not (outside / "evil.txt").exists()
 
 
-def test_fs_safe_write_refuses_intermediate_symlink_component(tmp_path):
+def test_fs_safe_write_refuses_intermediate_symlink_component(fs_root):
     """Symlinks in intermediate path components must be refused."""
 
-    root = tmp_path / "root"
-    outside = tmp_path / "outside"
+    root = fs_root / "root"
+    outside = fs_root / "outside"
     root.mkdir()
     outside.mkdir()
 
@@ -62,11 +87,11 @@ def test_fs_safe_write_refuses_intermediate_symlink_component(tmp_path):
     assert not (outside / "b" / "evil.txt").exists()
 
 
-def test_fs_safe_read_refuses_intermediate_symlink_component(tmp_path):
+def test_fs_safe_read_refuses_intermediate_symlink_component(fs_root):
     """Reading through a pre-existing symlink component must be refused."""
 
-    root = tmp_path / "root"
-    outside = tmp_path / "outside"
+    root = fs_root / "root"
+    outside = fs_root / "outside"
     root.mkdir()
     outside.mkdir()
 
@@ -79,7 +104,7 @@ def test_fs_safe_read_refuses_intermediate_symlink_component(tmp_path):
         safe_open_storage_for_read(storage, name="a/b/secret.txt")
 
 
-def test_fs_safe_requires_storage_path_method(tmp_path):
+def test_fs_safe_requires_storage_path_method():
     """fs_safe helpers must not run against storages without a local path."""
 
     class NoPathStorage:
@@ -90,10 +115,10 @@ def test_fs_safe_requires_storage_path_method(tmp_path):
         safe_open_storage_for_read(NoPathStorage(), name="x.txt")
 
 
-def test_fs_safe_fails_closed_without_openat_support(tmp_path, monkeypatch):
+def test_fs_safe_fails_closed_without_openat_support(fs_root, monkeypatch):
     """If openat/dir_fd support is not available, fs_safe must fail closed."""
 
-    root = tmp_path / "root"
+    root = fs_root / "root"
     root.mkdir()
     storage = FileSystemStorage(location=str(root))
 
@@ -1,10 +1,12 @@
 """Test the Item text preview/editor endpoint."""
 
 from io import BytesIO
+from unittest import mock
 
 from django.core.files.storage import default_storage
 
 import pytest
+from botocore.exceptions import ClientError
 from rest_framework.test import APIClient
 
 from core import factories, models
@@ -30,6 +32,13 @@ def _create_text_item(*, content: bytes, filename: str = "note.txt"):
     return item, user
 
 
+def _client_for(user):
+    """API client authenticated as `user` without creating a session."""
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
 def _create_file_item(*, content: bytes, filename: str, mimetype: str):
     item, user = _create_text_item(content=content, filename=filename)
     item.mimetype = mimetype
@@ -41,8 +50,7 @@ def test_api_items_text_get_ok():
     """Eligible text files should return content + ETag."""
     item, user = _create_text_item(content=b"hello")
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     response = client.get(f"/api/v1.0/items/{item.id}/text/")
 
     assert response.status_code == 200
@@ -54,13 +62,30 @@ def test_api_items_text_get_ok():
     assert payload["etag"] == response.headers["ETag"]
 
 
+def test_api_items_text_get_if_none_match_returns_304():
+    """A matching If-None-Match must short-circuit with 304 and no body."""
+    item, user = _create_text_item(content=b"hello")
+
+    client = _client_for(user)
+    etag = client.get(f"/api/v1.0/items/{item.id}/text/").headers["ETag"]
+
+    response = client.get(f"/api/v1.0/items/{item.id}/text/", HTTP_IF_NONE_MATCH=f"W/{etag}")
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    response = client.get(f"/api/v1.0/items/{item.id}/text/", HTTP_IF_NONE_MATCH='"stale"')
+    assert response.status_code == 200
+    assert response.json()["content"] == "hello"
+
+
 def test_api_items_text_get_truncated():
     """Text previews must be truncated at 500KB and report the truncation."""
     max_bytes = 500 * 1024
     item, user = _create_text_item(content=b"a" * (max_bytes + 1))
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     response = client.get(f"/api/v1.0/items/{item.id}/text/")
 
     assert response.status_code == 200
@@ -75,8 +100,7 @@ def test_api_items_text_put_ok_and_updates_etag():
     """Saving requires If-Match and updates storage content."""
     item, user = _create_text_item(content=b"hello")
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     get_resp = client.get(f"/api/v1.0/items/{item.id}/text/")
     etag = get_resp.headers.get("ETag")
     assert etag
@@ -98,8 +122,7 @@ def test_api_items_text_put_etag_mismatch_returns_412():
     """If-Match mismatch must return 412 to prevent lost updates."""
     item, user = _create_text_item(content=b"hello")
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     get_resp = client.get(f"/api/v1.0/items/{item.id}/text/")
     etag = get_resp.headers.get("ETag")
     assert etag
@@ -126,6 +149,61 @@ def test_api_items_text_put_etag_mismatch_returns_412():
     }
 
 
+def test_api_items_text_put_conditional_write_conflict_returns_412():
+    """A write racing in after the If-Match check is rejected by the store with 412."""
+    item, user = _create_text_item(content=b"hello")
+
+    client = _client_for(user)
+    etag = client.get(f"/api/v1.0/items/{item.id}/text/").headers["ETag"]
+
+    s3_client = default_storage.connection.meta.client
+    conflict = ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+    with mock.patch.object(s3_client, "put_object", side_effect=conflict) as put_object:
+        put_resp = client.put(
+            f"/api/v1.0/items/{item.id}/text/",
+            data={"content": "updated"},
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+    assert put_resp.status_code == 412
+    assert put_resp.json()["errors"][0]["code"] == "item.text.changed"
+    assert put_object.call_args.kwargs["IfMatch"]
+    assert client.get(f"/api/v1.0/items/{item.id}/text/").json()["content"] == "hello"
+
+
+def test_api_items_text_put_retries_unconditionally_without_conditional_writes():
+    """Stores that reject If-Match on PutObject with NotImplemented still get the write."""
+    item, user = _create_text_item(content=b"hello")
+
+    client = _client_for(user)
+    etag = client.get(f"/api/v1.0/items/{item.id}/text/").headers["ETag"]
+
+    s3_client = default_storage.connection.meta.client
+    real_put_object = s3_client.put_object
+
+    def put_object_without_if_match(**kwargs):
+        if "IfMatch" in kwargs:
+            raise ClientError({"Error": {"Code": "NotImplemented"}}, "PutObject")
+        return real_put_object(**kwargs)
+
+    with mock.patch.object(
+        s3_client, "put_object", side_effect=put_object_without_if_match
+    ) as put_object:
+        put_resp = client.put(
+            f"/api/v1.0/items/{item.id}/text/",
+            data={"content": "updated"},
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+    assert put_resp.status_code == 200
+    assert put_object.call_count == 2
+    assert put_object.call_args_list[0].kwargs["IfMatch"]
+    assert "IfMatch" not in put_object.call_args_list[1].kwargs
+    assert client.get(f"/api/v1.0/items/{item.id}/text/").json()["content"] == "updated"
+
+
 def test_api_items_text_put_requires_update_permission():
     """Users without update ability must not be able to save."""
     folder = factories.ItemFactory(type=models.ItemTypeChoices.FOLDER)
@@ -143,8 +221,7 @@ def test_api_items_text_put_requires_update_permission():
 
     default_storage.save(item.file_key, BytesIO(b"hello"))
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     get_resp = client.get(f"/api/v1.0/items/{item.id}/text/")
     etag = get_resp.headers.get("ETag") or '"missing"'
 
@@ -162,8 +239,7 @@ def test_api_items_text_put_large_file_refused():
     max_bytes = 500 * 1024
     item, user = _create_text_item(content=b"a" * (max_bytes + 1))
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     get_resp = client.get(f"/api/v1.0/items/{item.id}/text/")
     etag = get_resp.headers.get("ETag")
     assert etag
@@ -186,8 +262,7 @@ def test_api_items_text_get_octet_stream_inf_is_eligible():
         mimetype="application/octet-stream",
     )
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     response = client.get(f"/api/v1.0/items/{item.id}/text/")
 
     assert response.status_code == 200
@@ -205,8 +280,7 @@ def test_api_items_text_get_octet_stream_unknown_extension_sniff_ok():
         mimetype="application/octet-stream",
     )
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     response = client.get(f"/api/v1.0/items/{item.id}/text/")
 
     assert response.status_code == 200
@@ -221,8 +295,7 @@ def test_api_items_text_get_octet_stream_sys_with_nul_is_rejected():
         mimetype="application/octet-stream",
     )
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     response = client.get(f"/api/v1.0/items/{item.id}/text/")
 
     assert response.status_code in {400, 415}
@@ -243,8 +316,7 @@ def test_api_items_text_get_utf16le_bom_is_decoded_read_only():
         mimetype="application/octet-stream",
     )
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     response = client.get(f"/api/v1.0/items/{item.id}/text/")
 
     assert response.status_code == 200
@@ -262,8 +334,7 @@ def test_api_items_text_get_cp1252_fallback_is_read_only():
         mimetype="application/octet-stream",
     )
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     response = client.get(f"/api/v1.0/items/{item.id}/text/")
 
     assert response.status_code == 200
@@ -282,8 +353,7 @@ def test_api_items_text_put_rejected_for_utf16():
         mimetype="application/octet-stream",
     )
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     get_resp = client.get(f"/api/v1.0/items/{item.id}/text/")
     etag = get_resp.headers.get("ETag")
     assert etag
@@ -306,8 +376,7 @@ def test_api_items_text_put_rejected_for_cp1252_fallback():
         mimetype="application/octet-stream",
     )
 
-    client = APIClient()
-    client.force_login(user)
+    client = _client_for(user)
     get_resp = client.get(f"/api/v1.0/items/{item.id}/text/")
     etag = get_resp.headers.get("ETag")
     assert etag
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import io
-import zipfile
-from io import BytesIO
+from pathlib import PurePosixPath
 
 import pytest
 from lasuite.drf.models.choices import RoleChoices
@@ -13,21 +12,20 @@ from rest_framework.test import APIClient
 
 from core import factories, models
 from core.archive.extract_mount import extract_archive_to_mount
+from core.mounts.providers import smb as smb_provider
 from core.mounts.providers.base import MountEntry, MountProviderError
 from core.services.mount_security import (
     MOUNT_ARCHIVE_EXTRACT_UNSAFE_ERROR_CODE,
     MOUNTS_SAFE_FOR_ARCHIVE_EXTRACT_PUBLIC_MESSAGE,
 )
+from core.tests.utils.archives import make_zip_bytes
 
 pytestmark = pytest.mark.django_db
 
 
-def _make_zip_bytes(entries: dict[str, bytes]) -> bytes:
-    buf = BytesIO()
-    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for name, content in entries.items():
-            zf.writestr(name, content)
-    return buf.getvalue()
+# Zip bytes are immutable: build them once at import.
+_ZIP_ROOT_TXT = make_zip_bytes({"root.txt": b"root"})
+_ZIP_TWO_ENTRIES = make_zip_bytes({"folder/hello.txt": b"hello", "root.txt": b"root"})
 
 
 def _make_smb_mount(*, mount_id: str) -> dict:
@@ -65,7 +63,7 @@ def test_api_mount_archive_extractions_refused_without_hardening_gate(settings):
         title="test.zip",
         mimetype="application/zip",
         update_upload_state=models.ItemUploadStateChoices.READY,
-        upload_bytes=_make_zip_bytes({"root.txt": b"root"}),
+        upload_bytes=_ZIP_ROOT_TXT,
         upload_bytes__filename="test.zip",
     )
 
@@ -103,7 +101,7 @@ def test_api_mount_archive_extractions_returns_unavailable_when_mount_lacks_requ
         title="test.zip",
         mimetype="application/zip",
         update_upload_state=models.ItemUploadStateChoices.READY,
-        upload_bytes=_make_zip_bytes({"root.txt": b"root"}),
+        upload_bytes=_ZIP_ROOT_TXT,
         upload_bytes__filename="test.zip",
     )
 
@@ -153,9 +151,7 @@ def test_api_mount_archive_extractions_returns_unavailable_when_mount_lacks_requ
     assert resp.json()["errors"][0]["code"] == "mount.archive_extract.unavailable"
 
 
-def test_api_mount_archive_extractions_extracts_zip_when_gate_enabled(  # noqa: PLR0915
-    monkeypatch, settings
-):
+def test_api_mount_archive_extractions_extracts_zip_when_gate_enabled(monkeypatch, settings):
     """Gate on => job runs and writes extracted files to the provider."""
 
     monkeypatch.setenv("MOUNTS_SAFE_FOR_ARCHIVE_EXTRACT", "true")
@@ -174,7 +170,7 @@ def test_api_mount_archive_extractions_extracts_zip_when_gate_enabled(  # noqa:
         title="test.zip",
         mimetype="application/zip",
         update_upload_state=models.ItemUploadStateChoices.READY,
-        upload_bytes=_make_zip_bytes({"folder/hello.txt": b"hello", "root.txt": b"root"}),
+        upload_bytes=_ZIP_TWO_ENTRIES,
         upload_bytes__filename="test.zip",
     )
 
@@ -211,18 +207,9 @@ def test_api_mount_archive_extractions_extracts_zip_when_gate_enabled(  # noqa:
 
     def _fake_mkdirs(*, mount: dict, normalized_path: str) -> None:
         _ = mount
-        parts = normalized_path.split("/")
-        cur = ""
-        for p in parts:
-            if p == "":
-                cur = "/"
-                dirs.add(cur)
-                continue
-            if cur == "/":
-                cur = f"/{p}"
-            else:
-                cur = f"{cur}/{p}"
-            dirs.add(cur)
+        path = PurePosixPath(normalized_path)
+        dirs.update(str(parent) for parent in path.parents)
+        dirs.add(str(path))
 
     @contextlib.contextmanager
     def _fake_open_write(*, mount: dict, normalized_path: str):
@@ -241,11 +228,16 @@ def test_api_mount_archive_extractions_extracts_zip_when_gate_enabled(  # noqa:
         _ = mount
         files.pop(normalized_path, None)
 
-    monkeypatch.setattr("core.mounts.providers.smb.stat", _fake_stat)
-    monkeypatch.setattr("core.mounts.providers.smb.mkdirs", _fake_mkdirs)
-    monkeypatch.setattr("core.mounts.providers.smb.open_write", _fake_open_write)
-    monkeypatch.setattr("core.mounts.providers.smb.rename", _fake_rename)
-    monkeypatch.setattr("core.mounts.providers.smb.remove", _fake_remove)
+    # The registry holds the smb module itself, so patch its functions in place.
+    fake_smb_io = {
+        "stat": _fake_stat,
+        "mkdirs": _fake_mkdirs,
+        "open_write": _fake_open_write,
+        "rename": _fake_rename,
+        "remove": _fake_remove,
+    }
+    for name, fake in fake_smb_io.items():
+        monkeypatch.setattr(smb_provider, name, fake)
 
     client = APIClient()
     client.force_login(user)
@@ -289,7 +281,7 @@ def test_extract_archive_to_mount_runtime_stays_fail_closed_when_required_io_is_
         title="test.zip",
         mimetype="application/zip",
         update_upload_state=models.ItemUploadStateChoices.READY,
-        upload_bytes=_make_zip_bytes({"root.txt": b"root"}),
+        upload_bytes=_ZIP_ROOT_TXT,
         upload_bytes__filename="test.zip",
     )
 
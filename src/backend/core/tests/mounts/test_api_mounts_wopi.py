@@ -336,7 +336,7 @@ def test_wopi_mount_put_file_streams_and_updates_version(monkeypatch, settings):
     )
     assert lock.status_code == 200
 
-    body = b"a" * (64 * 1024 + 123)
+    body = b"a" * (wopi_viewsets.WOPI_IO_CHUNK_SIZE + 123)
     put = api.post(
         f"/api/v1.0/wopi/mount-files/{file_id}/contents/",
         data=body,
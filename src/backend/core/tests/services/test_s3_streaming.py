@@ -74,7 +74,7 @@ def test_stream_to_s3_object_uses_simple_put_when_body_stream_is_none():
     assert s3_client.calls[0][1]["Body"] == b""
 
 
-def test_stream_to_s3_object_falls_back_to_put_object_for_empty_stream():
+def test_stream_to_s3_object_uses_simple_put_for_empty_stream():
     s3_client = FakeS3Client()
 
     version_id, bytes_written = stream_to_s3_object(
@@ -86,11 +86,9 @@ def test_stream_to_s3_object_falls_back_to_put_object_for_empty_stream():
     )
 
     assert (version_id, bytes_written) == ("put-v1", 0)
-    assert [call[0] for call in s3_client.calls] == [
-        "create_multipart_upload",
-        "put_object",
-    ]
-    assert s3_client.calls[1][1]["Body"] == b""
+    assert [call[0] for call in s3_client.calls] == ["put_object"]
+    assert s3_client.calls[0][1]["Body"] == b""
+    assert s3_client.calls[0][1]["ContentType"] == "text/plain"
 
 
 def test_stream_to_s3_object_uploads_parts_by_chunks_and_returns_complete_version():
@@ -120,6 +118,77 @@ def test_stream_to_s3_object_uploads_parts_by_chunks_and_returns_complete_versio
     ]
 
 
+class ShortReadStream(io.RawIOBase):
+    """Stream returning at most `max_read` bytes per call, like a socket."""
+
+    def __init__(self, data: bytes, max_read: int):
+        self._buffer = io.BytesIO(data)
+        self._max_read = max_read
+
+    def read(self, size=-1):
+        return self._buffer.read(min(size, self._max_read))
+
+
+def test_stream_to_s3_object_fills_parts_across_short_reads():
+    s3_client = FakeS3Client()
+
+    version_id, bytes_written = stream_to_s3_object(
+        s3_client=s3_client,
+        bucket="drive-bucket",
+        key="items/archive.bin",
+        body_stream=ShortReadStream(b"abcdefghij", max_read=3),
+        content_type="application/octet-stream",
+        chunk_size=4,
+    )
+
+    part_calls = [kwargs for name, kwargs in s3_client.calls if name == "upload_part"]
+    assert (version_id, bytes_written) == ("complete-v1", 10)
+    assert [call["Body"] for call in part_calls] == [b"abcd", b"efgh", b"ij"]
+
+
+def test_stream_to_s3_object_uploads_parts_in_parallel_in_order():
+    s3_client = FakeS3Client()
+
+    version_id, bytes_written = stream_to_s3_object(
+        s3_client=s3_client,
+        bucket="drive-bucket",
+        key="items/archive.bin",
+        body_stream=io.BytesIO(b"abcdefghij"),
+        content_type="application/octet-stream",
+        chunk_size=2,
+        max_concurrency=2,
+    )
+
+    part_calls = [kwargs for name, kwargs in s3_client.calls if name == "upload_part"]
+    complete_call = next(
+        kwargs for name, kwargs in s3_client.calls if name == "complete_multipart_upload"
+    )
+
+    assert (version_id, bytes_written) == ("complete-v1", 10)
+    assert sorted(call["PartNumber"] for call in part_calls) == [1, 2, 3, 4, 5]
+    assert complete_call["MultipartUpload"]["Parts"] == [
+        {"ETag": f"etag-{number}", "PartNumber": number} for number in range(1, 6)
+    ]
+
+
+def test_stream_to_s3_object_aborts_parallel_upload_after_parts_settle():
+    s3_client = FakeS3Client(fail_on="upload_part")
+
+    with pytest.raises(RuntimeError, match="upload-failed"):
+        stream_to_s3_object(
+            s3_client=s3_client,
+            bucket="drive-bucket",
+            key="items/archive.bin",
+            body_stream=io.BytesIO(b"abcdef"),
+            content_type="application/octet-stream",
+            chunk_size=2,
+            max_concurrency=2,
+        )
+
+    assert s3_client.calls[-1][0] == "abort_multipart_upload"
+    assert "complete_multipart_upload" not in [call[0] for call in s3_client.calls]
+
+
 def test_stream_to_s3_object_uses_head_object_when_complete_response_has_no_version_id():
     s3_client = FakeS3Client(complete_version_id=None, head_version_id="head-v2")
 
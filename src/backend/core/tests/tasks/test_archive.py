@@ -52,3 +52,83 @@ def test_archive_task_wrappers_persist_failed_status_best_effort(
     assert payload["state"] == "failed"
     assert payload["errors"] == [{"detail": "boom"}]
     assert payload["user_id"] == "user-1"
+
+
+@pytest.mark.parametrize(
+    ("task_obj", "extract_patch", "get_patch"),
+    [
+        (
+            archive_tasks.extract_archive_to_drive_task,
+            "core.tasks.archive.extract_archive_to_drive",
+            "core.tasks.archive.get_archive_extraction_job_status",
+        ),
+        (
+            archive_tasks.extract_archive_to_mount_task,
+            "core.tasks.archive.extract_archive_to_mount",
+            "core.tasks.archive.get_mount_archive_extraction_job_status",
+        ),
+        (
+            archive_tasks.create_zip_from_items_task,
+            "core.tasks.archive.create_zip_from_items",
+            "core.tasks.archive.get_archive_zip_job_status",
+        ),
+    ],
+)
+def test_archive_task_wrappers_status_failure_does_not_mask_original_error(
+    task_obj,
+    extract_patch,
+    get_patch,
+):
+    with (
+        mock.patch(extract_patch, side_effect=ValueError("boom")),
+        mock.patch(get_patch, side_effect=ConnectionError("cache down")),
+        mock.patch("core.tasks.archive.logger.exception"),
+        mock.patch("core.tasks.archive.logger.warning") as mock_warning,
+    ):
+        with pytest.raises(ValueError, match="boom"):
+            task_obj.run(job_id="job-1", user_id="user-1")
+
+    mock_warning.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "task_obj",
+    [
+        archive_tasks.extract_archive_to_drive_task,
+        archive_tasks.extract_archive_to_mount_task,
+        archive_tasks.create_zip_from_items_task,
+    ],
+)
+def test_archive_task_wrappers_require_user_id(task_obj):
+    with pytest.raises(TypeError):
+        task_obj.run(job_id="job-1")
+
+
+def test_archive_task_failure_log_skips_traceback_outside_debug(settings):
+    settings.DEBUG = False
+    with (
+        mock.patch("core.tasks.archive.random.random", return_value=1.0),
+        mock.patch("core.tasks.archive.logger.exception") as mock_exception,
+        mock.patch("core.tasks.archive.logger.error") as mock_error,
+    ):
+        archive_tasks.log_job_failure("archive_zip", job_id="job-1", exc=ValueError("boom"))
+
+    mock_exception.assert_not_called()
+    mock_error.assert_called_once()
+    assert mock_error.call_args.kwargs["extra"] == {
+        "job_id": "job-1",
+        "exc_type": "ValueError",
+        "exc": "boom",
+    }
+
+
+def test_archive_task_failure_log_keeps_traceback_in_debug(settings):
+    settings.DEBUG = True
+    with (
+        mock.patch("core.tasks.archive.logger.exception") as mock_exception,
+        mock.patch("core.tasks.archive.logger.error") as mock_error,
+    ):
+        archive_tasks.log_job_failure("archive_zip", job_id="job-1", exc=ValueError("boom"))
+
+    mock_exception.assert_called_once()
+    mock_error.assert_not_called()
@@ -0,0 +1,44 @@
+"""Utils for building archives in tests."""
+
+import functools
+import stat
+import zipfile
+from io import BytesIO
+
+from django.core.files.storage import default_storage
+
+
+def make_zip_bytes(entries: dict[str, bytes], compression: int = zipfile.ZIP_STORED) -> bytes:
+    """
+    Build a zip file (as bytes) from a mapping of path -> content.
+
+    Entries are stored uncompressed unless a test needs real compression.
+    """
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w", compression=compression, compresslevel=1) as zf:
+        for name, content in entries.items():
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+@functools.cache
+def make_zip_with_symlink_entry() -> bytes:
+    """
+    Build a zip file containing a symlink entry (Info-ZIP style external_attr).
+
+    The result is immutable bytes, so it is built once per process.
+    """
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        info = zipfile.ZipInfo("link")
+        info.create_system = 3  # Unix
+        info.external_attr = (stat.S_IFLNK | 0o777) << 16
+        zf.writestr(info, "target")
+        zf.writestr("ok.txt", b"ok")
+    return buf.getvalue()
+
+
+def read_storage_key(key: str) -> bytes:
+    """Read an object from the default storage, closing the handle afterwards."""
+    with default_storage.open(key, "rb") as fp:
+        return fp.read()
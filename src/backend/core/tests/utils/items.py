@@ -0,0 +1,32 @@
+"""Utils for creating items in tests."""
+
+from io import BytesIO
+
+from django.core.files.storage import default_storage
+
+from lasuite.drf.models.choices import LinkReachChoices
+
+from core import models
+
+
+def make_file_item(*, creator, parent, title, content, mimetype):
+    """
+    Create a ready file item under `parent` and store `content` at its storage key.
+
+    Costs one INSERT and one UPDATE, where `ItemFactory(update_upload_state=...,
+    upload_bytes=...)` saves the whole row twice after creating it.
+    """
+    item = models.Item.objects.create_child(
+        creator=creator,
+        parent=parent,
+        type=models.ItemTypeChoices.FILE,
+        title=title,
+        filename=title,
+        mimetype=mimetype,
+        link_reach=LinkReachChoices.RESTRICTED,
+    )
+    item.upload_state = models.ItemUploadStateChoices.READY
+    item.size = len(content)
+    item.save(update_fields=["upload_state", "size", "updated_at"])
+    default_storage.save(item.file_key, BytesIO(content))
+    return item
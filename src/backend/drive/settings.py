@@ -1896,6 +1896,10 @@ class Base(Configuration):
     WOPI_DISABLE_CHAT = values.IntegerValue(
         0, environ_name="WOPI_DISABLE_CHAT", environ_prefix=None
     )
+    # Multipart parts uploaded in parallel by PutFile, per request.
+    WOPI_PUT_FILE_UPLOAD_CONCURRENCY = values.PositiveIntegerValue(
+        4, environ_name="WOPI_PUT_FILE_UPLOAD_CONCURRENCY", environ_prefix=None
+    )
     WOPI_LEGACY_CONVERSION_TARGETS = {
         "doc": "docx",
         "xls": "xlsx",
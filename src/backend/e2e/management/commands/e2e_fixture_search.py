@@ -1,6 +1,7 @@
 """E2E fixture search."""
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from e2e.services.bootstrap import seed_search_dataset
 from e2e.utils import ensure_main_workspace, get_or_create_e2e_user
@@ -13,10 +14,15 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """E2E fixture search."""
-        user = get_or_create_e2e_user("drive@example.com")
-        workspace = ensure_main_workspace(user)
+        # The tree is small but built row by row (ltree paths, storage objects,
+        # create-or-reuse lookups): commit it once instead of per statement.
+        with transaction.atomic():
+            user = get_or_create_e2e_user("drive@example.com")
+            workspace = ensure_main_workspace(user)
 
-        # Create items under the user's main workspace so they are visible in "My files"
-        # and discoverable through the default explorer/search scope.
-        for item in seed_search_dataset(parent=workspace, creator=user):
+            # Create items under the user's main workspace so they are visible in "My files"
+            # and discoverable through the default explorer/search scope.
+            items = seed_search_dataset(parent=workspace, creator=user)
+
+        for item in items:
             self.stdout.write(f"Item created or reused: {item.title}")
@@ -7,6 +7,7 @@ from django.test.utils import override_settings
 import pytest
 from rest_framework.test import APIClient
 
+from core import factories, models
 from core.tests.utils.urls import reload_urls
 
 pytestmark = pytest.mark.django_db
@@ -111,6 +112,26 @@ def test_api_e2e_clear_db_requires_s2s_token():
     assert "cleared_table_count" in response.json()
 
 
+@override_settings(LOAD_E2E_URLS=True, SERVER_TO_SERVER_API_TOKENS=["drive-e2e-s2s"])
+def test_api_e2e_clear_db_truncates_non_empty_tables():
+    """Tables holding rows are cleared; the reported count covers every table."""
+    reload_urls()
+    factories.ItemFactory(type=models.ItemTypeChoices.FOLDER)
+    assert models.User.objects.exists()
+
+    response = APIClient().post(
+        "/api/v1.0/e2e/clear-db/",
+        {},
+        format="json",
+        HTTP_AUTHORIZATION="Bearer drive-e2e-s2s",
+    )
+
+    assert response.status_code == 200
+    assert response.json()["cleared_table_count"] > 0
+    assert not models.User.objects.exists()
+    assert not models.Item.objects.exists()
+
+
 @override_settings(
     LOAD_E2E_URLS=True,
     SERVER_TO_SERVER_API_TOKENS=["drive-e2e-s2s"],
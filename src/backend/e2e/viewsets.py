@@ -1,12 +1,13 @@
 """Viewsets for the e2e app."""
 
 import io
+import threading
 import urllib.parse
 
 from django.conf import settings
 from django.contrib.auth import login
 from django.core.management import call_command
-from django.db import connection
+from django.db import connection, transaction
 from django.http import Http404, HttpResponseRedirect
 from django.middleware.csrf import get_token
 
@@ -17,6 +18,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 
 from e2e.authentication import ServerToServerAuthentication
+from e2e.management.commands import e2e_fixture_search
 from e2e.serializers import (
     E2EAuthSerializer,
     E2EBootstrapScenarioSerializer,
@@ -30,6 +32,22 @@ from e2e.utils import (
     get_or_create_e2e_user,
 )
 
+
+class _DiscardingTextIO(io.TextIOBase):
+    """Write-only text stream that drops everything written to it."""
+
+    def writable(self) -> bool:
+        """Accept writes."""
+        return True
+
+    def write(self, s: str) -> int:
+        """Drop `s`, reporting it as fully written."""
+        return len(s)
+
+
+# Shared sink for management command output nobody reads: no buffer, no file handle.
+_DISCARD_OUTPUT = _DiscardingTextIO()
+
 QA_BROWSER_BOOTSTRAP_RUN_ID = "qa-lan-browser"
 QA_BROWSER_BOOTSTRAP_WORKER_ID = "manual-browser"
 QA_BROWSER_BOOTSTRAP_ACTOR_KEY = "primary"
@@ -80,13 +98,15 @@ class UserAuthViewSet(drf.viewsets.ViewSet):
         serializer = E2EAuthSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = get_or_create_e2e_user(
-            serializer.validated_data["email"],
-            language=None,
-        )
+        # User, session and workspace writes commit together.
+        with transaction.atomic():
+            user = get_or_create_e2e_user(
+                serializer.validated_data["email"],
+                language=None,
+            )
 
-        login(request, user, "django.contrib.auth.backends.ModelBackend")
-        ensure_main_workspace(user)
+            login(request, user, "django.contrib.auth.backends.ModelBackend")
+            ensure_main_workspace(user)
         # Ensure the CSRF cookie is set for subsequent SPA mutations.
         # This endpoint is called via Playwright's APIRequestContext (not subject to CORS),
         # so setting the cookie here is the most reliable way to bootstrap the browser state.
@@ -278,6 +298,9 @@ class CleanupScopeAPIView(APIView):
         return drf_response.Response(payload, status=status.HTTP_200_OK)
 
 
+_CLEAR_DB_EXCLUDED_TABLES = frozenset({"django_migrations", "django_site"})
+
+
 def _quote_ident(name: str) -> str:
     return f'"{name.replace(chr(34), chr(34) * 2)}"'
 
@@ -293,25 +316,59 @@ class ClearDbAPIView(APIView):
     permission_classes = [AllowAny]
     authentication_classes = [ServerToServerAuthentication]
 
+    # The table list only changes with migrations: introspect once per process.
+    _tables_lock = threading.Lock()
+    _quoted_tables: tuple[str, ...] | None = None
+    _non_empty_probe_sql = ""
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Forget the cached table list (e.g. after migrating in-process)."""
+        with cls._tables_lock:
+            cls._quoted_tables = None
+            cls._non_empty_probe_sql = ""
+
+    @classmethod
+    def _get_tables(cls) -> tuple[tuple[str, ...], str]:
+        """Return the quoted table names and a query listing the non-empty ones."""
+        with cls._tables_lock:
+            if cls._quoted_tables is None:
+                # Managed model and many-to-many tables that exist in the
+                # database: the same set `flush` clears.
+                table_names = connection.introspection.django_table_names(
+                    only_existing=True, include_views=False
+                )
+                cls._quoted_tables = tuple(
+                    _quote_ident(name)
+                    for name in sorted(table_names)
+                    if name not in _CLEAR_DB_EXCLUDED_TABLES
+                )
+                # One round-trip: each branch stops at the first row of its table.
+                # Only integer indexes and quoted table names from the app
+                # registry are interpolated, never request data.
+                cls._non_empty_probe_sql = " UNION ALL ".join(
+                    f"SELECT {index} WHERE EXISTS (SELECT 1 FROM {table})"  # noqa: S608
+                    for index, table in enumerate(cls._quoted_tables)
+                )
+            return cls._quoted_tables, cls._non_empty_probe_sql
+
     def post(self, request):
         """Truncate application tables for E2E legacy readiness checks only."""
         with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT tablename
-                FROM pg_tables
-                WHERE schemaname = 'public'
-                  AND tablename NOT IN ('django_migrations', 'django_site')
-                """
-            )
-            tables = [row[0] for row in cursor.fetchall()]
-
+            tables, probe_sql = self._get_tables()
+            table_count = len(tables)
             if tables:
-                stmt = "TRUNCATE TABLE " + ", ".join(_quote_ident(t) for t in tables) + " CASCADE"
-                cursor.execute(stmt)
+                # Truncating an empty table still swaps its files and takes an
+                # exclusive lock: only clear the tables that hold rows.
+                cursor.execute(probe_sql)
+                non_empty = [tables[row[0]] for row in cursor.fetchall()]
+                if non_empty:
+                    cursor.execute(
+                        "TRUNCATE TABLE " + ", ".join(non_empty) + " RESTART IDENTITY CASCADE"
+                    )
 
         return drf_response.Response(
-            {"cleared_table_count": len(tables)},
+            {"cleared_table_count": table_count},
             status=status.HTTP_200_OK,
         )
 
@@ -327,7 +384,9 @@ class RunFixtureAPIView(APIView):
     permission_classes = [AllowAny]
     authentication_classes = [ServerToServerAuthentication]
 
-    ALLOWLIST = {"e2e_fixture_search"}
+    # Resolved at import: call_command() then skips the per-call app command scan.
+    FIXTURE_COMMANDS = {"e2e_fixture_search": e2e_fixture_search.Command}
+    ALLOWLIST: frozenset[str] = frozenset(FIXTURE_COMMANDS)
 
     def post(self, request):
         """Run an allowlisted E2E fixture command."""
@@ -344,9 +403,13 @@ class RunFixtureAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        stdout = io.StringIO()
-        stderr = io.StringIO()
-        call_command(fixture, stdout=stdout, stderr=stderr)
+        # Fixture output is never returned: discard it rather than buffering it.
+        call_command(
+            self.FIXTURE_COMMANDS[fixture](),
+            stdout=_DISCARD_OUTPUT,
+            stderr=_DISCARD_OUTPUT,
+            verbosity=0,
+        )
 
         return drf_response.Response(
             {"fixture": fixture, "status": "ok"},
@@ -25,6 +25,10 @@ class LockService:
         """Lock the item."""
         cache.set(self._lock_key, lock_value, timeout=self.lock_timeout)
 
+    def lock_if_unlocked(self, lock_value: str) -> bool:
+        """Lock the item unless it is already locked; return whether it was locked."""
+        return cache.add(self._lock_key, lock_value, timeout=self.lock_timeout)
+
     def get_lock(self, default: str = None):
         """Get the lock."""
         return cache.get(self._lock_key, default)
@@ -55,16 +59,17 @@ class MountLockService:
     def __init__(self, *, mount_id: str, normalized_path: str):
         self.mount_id = str(mount_id or "").strip()
         self._path_hash = sha256_16(str(normalized_path or ""))
-
-    @property
-    def _lock_key(self) -> str:
-        """Return the cache key for the mount lock (hashed path)."""
-        return f"{self.lock_prefix}:{self.mount_id}:{self._path_hash}"
+        # Cache key for the mount lock (hashed path), built once per service.
+        self._lock_key = f"{self.lock_prefix}:{self.mount_id}:{self._path_hash}"
 
     def lock(self, lock_value: str) -> None:
         """Acquire a lock with a deterministic TTL."""
         cache.set(self._lock_key, lock_value, timeout=self.lock_timeout)
 
+    def lock_if_unlocked(self, lock_value: str) -> bool:
+        """Acquire the lock only if none exists; return whether it was acquired."""
+        return cache.add(self._lock_key, lock_value, timeout=self.lock_timeout)
+
     def get_lock(self, default: str = None):
         """Return the current lock value (or default when missing)."""
         return cache.get(self._lock_key, default)
@@ -1,9 +1,9 @@
-"""Test the LockService."""
+"""Test the LockService and MountLockService."""
 
 import pytest
 
 from core import factories
-from wopi.services.lock import LockService
+from wopi.services.lock import LockService, MountLockService
 
 pytestmark = pytest.mark.django_db
 
@@ -26,3 +26,27 @@ def test_lock_service():
     lock_service.unlock()
     assert lock_service.is_locked() is False
     assert lock_service.get_lock() is None
+
+
+def test_lock_service_lock_if_unlocked():
+    """Locking if unlocked never replaces an existing lock."""
+    item = factories.ItemFactory()
+
+    lock_service = LockService(item)
+    assert lock_service.lock_if_unlocked("1234567890") is True
+    assert lock_service.lock_if_unlocked("1234567891") is False
+    assert lock_service.get_lock() == "1234567890"
+
+
+def test_mount_lock_service_lock_if_unlocked():
+    """Locking a mount entry if unlocked never replaces an existing lock."""
+    lock_service = MountLockService(mount_id="mount-a", normalized_path="/docs/report.docx")
+    other_path = MountLockService(mount_id="mount-a", normalized_path="/docs/other.docx")
+
+    assert lock_service.lock_if_unlocked("1234567890") is True
+    assert lock_service.lock_if_unlocked("1234567891") is False
+    assert lock_service.get_lock() == "1234567890"
+    assert other_path.lock_if_unlocked("1234567891") is True
+
+    lock_service.unlock()
+    other_path.unlock()
@@ -138,3 +138,47 @@ def test_lock_file_on_an_already_locked_file_with_mismatching_lock_header():
     assert response.headers.get("X-WOPI-Lock") == "1234567890"
     assert lock_service.is_locked()
     assert lock_service.get_lock() == "1234567890"
+
+
+def test_lock_file_losing_a_concurrent_lock_race():
+    """A LOCK that loses the race to a concurrent LOCK returns 409 with the winner's lock."""
+    folder = factories.ItemFactory(
+        type=models.ItemTypeChoices.FOLDER,
+    )
+    item = factories.ItemFactory(
+        type=models.ItemTypeChoices.FILE,
+        parent=folder,
+        filename="wopi_test.txt",
+        update_upload_state=models.ItemUploadStateChoices.READY,
+    )
+    user = factories.UserFactory()
+    factories.UserItemAccessFactory(item=item, user=user, role=models.RoleChoices.EDITOR)
+
+    service = AccessUserItemService()
+    access_token, _ = service.insert_new_access(item, user)
+
+    lock_service = LockService(item)
+    lock_service.lock("winner")
+
+    real_get_lock = LockService.get_lock
+    reads = []
+
+    def get_lock_before_the_winner(self, default=None):
+        # The first read happens before the concurrent LOCK has stored its value.
+        reads.append(default)
+        if len(reads) == 1:
+            return default
+        return real_get_lock(self, default)
+
+    client = APIClient()
+    with patch.object(LockService, "get_lock", get_lock_before_the_winner):
+        response = client.post(
+            f"/api/v1.0/wopi/files/{item.id}/",
+            HTTP_AUTHORIZATION=f"Bearer {access_token}",
+            headers={"X-WOPI-Override": "LOCK", "X-WOPI-Lock": "loser"},
+        )
+
+    assert response.status_code == 409
+    assert response.headers.get("X-WOPI-Lock") == "winner"
+    assert len(reads) == 2
+    assert lock_service.get_lock() == "winner"
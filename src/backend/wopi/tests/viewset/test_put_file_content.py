@@ -1,5 +1,8 @@
 """Test the PUT file content viewset."""
 
+from io import BytesIO
+from unittest import mock
+
 from django.core.files.storage import default_storage
 from django.http import HttpRequest
 
@@ -570,3 +573,66 @@ def test_put_file_content_allows_lockless_body_when_creating_and_transitions_rea
     item.refresh_from_db()
     assert item.upload_state == models.ItemUploadStateChoices.READY
     assert item.size == len(b"new content")
+
+
+def test_put_file_content_locked_ready_item_skips_head_object():
+    """A locked save of a READY file needs no storage HEAD before the upload."""
+    item, access_token = _setup_wopi_putfile_item(size=3)
+    default_storage.save(item.file_key, BytesIO(b"old"))
+
+    s3_client = default_storage.connection.meta.client
+    client = APIClient()
+    with mock.patch.object(s3_client, "head_object", wraps=s3_client.head_object) as head_object:
+        response = client.post(
+            f"/api/v1.0/wopi/files/{item.id}/contents/",
+            data=b"new content",
+            content_type="text/plain",
+            HTTP_AUTHORIZATION=f"Bearer {access_token}",
+            headers={
+                "X-WOPI-Override": "PUT",
+                "X-WOPI-Lock": "1234567890",
+            },
+        )
+
+    assert response.status_code == 200
+    head_object.assert_not_called()
+    item.refresh_from_db()
+    assert item.size == len(b"new content")
+
+
+def test_put_file_content_locked_creating_placeholder_is_deleted_before_upload():
+    """A locked save of a 0-byte CREATING placeholder still HEADs and deletes it first."""
+    item, access_token = _setup_wopi_putfile_item(size=0)
+    models.Item.objects.filter(pk=item.pk).update(
+        upload_state=models.ItemUploadStateChoices.CREATING
+    )
+    default_storage.save(item.file_key, BytesIO(b""))
+
+    s3_client = default_storage.connection.meta.client
+    client = APIClient()
+    with (
+        mock.patch.object(s3_client, "head_object", wraps=s3_client.head_object) as head_object,
+        mock.patch.object(
+            s3_client, "delete_object", wraps=s3_client.delete_object
+        ) as delete_object,
+    ):
+        response = client.post(
+            f"/api/v1.0/wopi/files/{item.id}/contents/",
+            data=b"new content",
+            content_type="text/plain",
+            HTTP_AUTHORIZATION=f"Bearer {access_token}",
+            headers={
+                "X-WOPI-Override": "PUT",
+                "X-WOPI-Lock": "1234567890",
+            },
+        )
+
+    assert response.status_code == 200
+    head_object.assert_called_once_with(Bucket=default_storage.bucket_name, Key=item.file_key)
+    delete_object.assert_called_once()
+    assert delete_object.call_args.kwargs["Key"] == item.file_key
+    item.refresh_from_db()
+    assert item.upload_state == models.ItemUploadStateChoices.READY
+    assert item.size == len(b"new content")
+    with default_storage.open(item.file_key, "rb") as stored:
+        assert stored.read() == b"new content"
@@ -4,12 +4,14 @@ from io import BytesIO
 from unittest.mock import patch
 
 from django.core.files.storage import default_storage
+from django.db import DatabaseError
 
 import botocore
 import pytest
 from rest_framework.test import APIClient
 
 from core import factories, models
+from core.services.regular_storage_copy import RegularStorageCopyResult
 from wopi.services.access import AccessUserItemService
 from wopi.services.lock import LockService
 from wopi.viewsets import X_WOPI_INVALIDFILENAMERROR, X_WOPI_LOCK
@@ -344,3 +346,114 @@ def test_rename_file_storage_error():
     item.refresh_from_db()
     assert item.filename == "wopi_test.txt"  # Original filename unchanged
     assert item.title == "wopi_test"  # Original title unchanged
+
+
+def _fail_rename_save(original_save):
+    """Wrap `Item.save` so only the rename's filename update fails."""
+
+    def save(self, *args, **kwargs):
+        if "filename" in (kwargs.get("update_fields") or ()):
+            raise DatabaseError("database unavailable")
+        return original_save(self, *args, **kwargs)
+
+    return save
+
+
+def test_rename_file_save_error_drops_the_copy():
+    """A failed save removes the renamed copy and keeps the source object."""
+    folder = factories.ItemFactory(
+        type=models.ItemTypeChoices.FOLDER,
+    )
+    item = factories.ItemFactory(
+        parent=folder,
+        type=models.ItemTypeChoices.FILE,
+        filename="wopi_test.txt",
+        title="wopi_test",
+        update_upload_state=models.ItemUploadStateChoices.READY,
+        link_reach=models.LinkReachChoices.RESTRICTED,
+        link_role=models.LinkRoleChoices.EDITOR,
+    )
+    old_file_key = item.file_key
+    new_file_key = f"{item.key_base}/new_name.txt"
+    user = factories.UserFactory()
+    factories.UserItemAccessFactory(item=item, user=user, role=models.RoleChoices.EDITOR)
+
+    service = AccessUserItemService()
+    access_token, _ = service.insert_new_access(item, user)
+
+    default_storage.save(old_file_key, BytesIO(b"my prose"))
+
+    client = APIClient()
+    with (
+        patch.object(models.Item, "save", _fail_rename_save(models.Item.save)),
+        pytest.raises(DatabaseError, match="database unavailable"),
+    ):
+        client.post(
+            f"/api/v1.0/wopi/files/{item.id}/",
+            HTTP_AUTHORIZATION=f"Bearer {access_token}",
+            headers={
+                "X-WOPI-Override": "RENAME_FILE",
+                "X-WOPI-RequestedName": "new_name",
+            },
+        )
+
+    item.refresh_from_db()
+    assert item.filename == "wopi_test.txt"
+    assert item.title == "wopi_test"
+    with default_storage.open(old_file_key, "rb") as source_file:
+        assert source_file.read() == b"my prose"
+    assert not default_storage.exists(new_file_key)
+
+
+def test_rename_file_save_error_deletes_the_copied_version():
+    """With versioning on, the failed rename deletes exactly the copied object version."""
+    folder = factories.ItemFactory(
+        type=models.ItemTypeChoices.FOLDER,
+    )
+    item = factories.ItemFactory(
+        parent=folder,
+        type=models.ItemTypeChoices.FILE,
+        filename="wopi_test.txt",
+        title="wopi_test",
+        update_upload_state=models.ItemUploadStateChoices.READY,
+        link_reach=models.LinkReachChoices.RESTRICTED,
+        link_role=models.LinkRoleChoices.EDITOR,
+    )
+    old_file_key = item.file_key
+    new_file_key = f"{item.key_base}/new_name.txt"
+    user = factories.UserFactory()
+    factories.UserItemAccessFactory(item=item, user=user, role=models.RoleChoices.EDITOR)
+
+    service = AccessUserItemService()
+    access_token, _ = service.insert_new_access(item, user)
+
+    default_storage.save(old_file_key, BytesIO(b"my prose"))
+
+    client = APIClient()
+    with (
+        patch(
+            "wopi.viewsets.copy_regular_storage_object",
+            return_value=RegularStorageCopyResult(
+                version_id="copy-version",
+                bytes_written=None,
+                used_streaming_fallback=False,
+            ),
+        ),
+        patch.object(default_storage.connection.meta.client, "delete_object") as delete_object,
+        patch.object(models.Item, "save", _fail_rename_save(models.Item.save)),
+        pytest.raises(DatabaseError, match="database unavailable"),
+    ):
+        client.post(
+            f"/api/v1.0/wopi/files/{item.id}/",
+            HTTP_AUTHORIZATION=f"Bearer {access_token}",
+            headers={
+                "X-WOPI-Override": "RENAME_FILE",
+                "X-WOPI-RequestedName": "new_name",
+            },
+        )
+
+    delete_object.assert_called_once_with(
+        Bucket=default_storage.bucket_name, Key=new_file_key, VersionId="copy-version"
+    )
+    with default_storage.open(old_file_key, "rb") as source_file:
+        assert source_file.read() == b"my prose"
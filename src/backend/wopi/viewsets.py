@@ -8,7 +8,6 @@ from os.path import splitext
 from django.conf import settings
 from django.core.exceptions import RequestDataTooBig
 from django.core.files.storage import default_storage
-from django.db import transaction
 from django.http import StreamingHttpResponse
 
 import botocore.exceptions
@@ -49,6 +48,10 @@ X_WOPI_INVALIDFILENAMERROR = "X-WOPI-InvalidFileNameError"
 X_WOPI_ITEMVERSION = "X-WOPI-ItemVersion"
 X_WOPI_LOCK = "X-WOPI-Lock"
 
+# GetFile/PutFile streaming block size (same as mount archive extraction): fewer
+# round-trips and generator steps while keeping per-request memory bounded.
+WOPI_IO_CHUNK_SIZE = 1024 * 1024
+
 
 WOPI_SHARED_DETAIL_POST_ACTIONS = {
     "LOCK": "_lock",
@@ -163,8 +166,8 @@ class WopiLockRuntimeMixin:
         The action is determined by the X-WOPI-Override header.
         """
 
-        override = request.META.get(HTTP_X_WOPI_OVERRIDE)
-        if override not in self.detail_post_actions:
+        post_action = self.detail_post_actions.get(request.META.get(HTTP_X_WOPI_OVERRIDE))
+        if post_action is None:
             return Response(status=404)
 
         preflight_hook = getattr(self, "_detail_post_preflight", None)
@@ -174,7 +177,6 @@ class WopiLockRuntimeMixin:
             if preflight is not None:
                 return preflight
 
-        post_action = self.detail_post_actions[override]
         return getattr(self, post_action)(request, pk)
 
     def _lock(self, request, pk=None):
@@ -191,14 +193,16 @@ class WopiLockRuntimeMixin:
         if isinstance(lock_service, Response):
             return lock_service
 
-        if not lock_service.is_locked():
-            lock_service.lock(lock_value)
-            return Response(status=200)
+        # One read decides between acquiring, refreshing and conflicting; the
+        # acquisition itself is an atomic add so concurrent LOCKs cannot both win.
+        current_lock_value = lock_service.get_lock(default="")
+        if not current_lock_value:
+            if lock_service.lock_if_unlocked(lock_value):
+                return Response(status=200)
+            current_lock_value = lock_service.get_lock(default="")
 
-        if not lock_service.is_lock_valid(lock_value):
-            return self._lock_conflict_response(
-                current_lock_value=lock_service.get_lock(default="")
-            )
+        if current_lock_value != lock_value:
+            return self._lock_conflict_response(current_lock_value=current_lock_value)
 
         lock_service.refresh_lock()
         return Response(status=200)
@@ -264,7 +268,7 @@ class WopiLockRuntimeMixin:
         if current_lock_value != old_lock_value:
             return self._lock_conflict_response(current_lock_value=current_lock_value)
 
-        lock_service.unlock()
+        # Setting the new value replaces the old lock: no separate delete needed.
         lock_service.lock(new_lock_value)
         return Response(status=200)
 
@@ -301,10 +305,19 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
         "RENAME_FILE": "_rename_file",
     }
 
+    # Viewsets are instantiated per request: abilities are computed at most once.
+    _item_abilities: dict | None = None
+
     def get_file_id(self):
         """Get the file id from the URL path."""
         return uuid.UUID(self.kwargs.get("pk"))
 
+    def _get_item_abilities(self, request) -> dict:
+        """Return the request user's abilities on the token item."""
+        if self._item_abilities is None:
+            self._item_abilities = request.auth.item.get_abilities(request.user)
+        return self._item_abilities
+
     # pylint: disable=unused-argument
     def retrieve(self, request, pk=None):
         """
@@ -312,7 +325,7 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
         https://learn.microsoft.com/en-us/microsoft-365/cloud-storage-partner-program/rest/files/checkfileinfo
         """
         item = request.auth.item
-        abilities = item.get_abilities(request.user)
+        abilities = self._get_item_abilities(request)
 
         head_object = get_item_file_head_object(item)
         wopi_client = get_wopi_client_config(item, request.user)
@@ -349,26 +362,27 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
         """
         item = request.auth.item
 
-        head_object = get_item_file_head_object(item)
-        preflight_response = get_wopi_max_expected_size_preflight_response(
-            actual_size=int(head_object["ContentLength"]),
-            max_expected_size=request.META.get("HTTP_X_WOPI_MAXEXPECTEDSIZE"),
-        )
-        if preflight_response is not None:
-            return preflight_response
-
+        # GetObject returns the size and version with the body: no separate HEAD,
+        # and the headers always describe the exact version being streamed.
         s3_client = default_storage.connection.meta.client
-
         file = s3_client.get_object(
             Bucket=default_storage.bucket_name,
             Key=item.file_key,
         )
+        preflight_response = get_wopi_max_expected_size_preflight_response(
+            actual_size=int(file["ContentLength"]),
+            max_expected_size=request.META.get("HTTP_X_WOPI_MAXEXPECTEDSIZE"),
+        )
+        if preflight_response is not None:
+            file["Body"].close()
+            return preflight_response
 
         return build_wopi_get_file_streaming_response(
-            streaming_content=file["Body"].iter_chunks(),
+            # botocore's default iter_chunks() size is 1 KiB.
+            streaming_content=file["Body"].iter_chunks(WOPI_IO_CHUNK_SIZE),
             content_type=item.mimetype,
-            version=str(head_object["VersionId"]),
-            size=int(head_object["ContentLength"]),
+            version=str(file["VersionId"]),
+            size=int(file["ContentLength"]),
         )
 
     def _put_file_content(  # noqa: PLR0911,PLR0912,PLR0915
@@ -386,7 +400,7 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
             return preflight_response
 
         item = request.auth.item
-        abilities = item.get_abilities(request.user)
+        abilities = self._get_item_abilities(request)
 
         if not abilities["update"]:
             return Response(status=401)
@@ -405,18 +419,22 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
         size_missing = False
         current_size = None
         current_version_id = None
-        try:
-            head_object = s3_client.head_object(
-                Bucket=default_storage.bucket_name, Key=item.file_key
-            )
-            current_size = int(head_object.get("ContentLength") or 0)
-            current_version_id = head_object.get("VersionId")
-        except botocore.exceptions.ClientError as exc:
-            code = str(exc.response.get("Error", {}).get("Code") or "")
-            if code in {"404", "NoSuchKey", "NotFound"}:
-                size_missing = True
-            else:
-                raise
+        # The object HEAD is only needed for the unlocked size check and for the
+        # editnew placeholder workaround below: locked saves of ready files skip it.
+        head_needed = not current_lock_value or item.upload_state == ItemUploadStateChoices.CREATING
+        if head_needed:
+            try:
+                head_object = s3_client.head_object(
+                    Bucket=default_storage.bucket_name, Key=item.file_key
+                )
+                current_size = int(head_object.get("ContentLength") or 0)
+                current_version_id = head_object.get("VersionId")
+            except botocore.exceptions.ClientError as exc:
+                code = str(exc.response.get("Error", {}).get("Code") or "")
+                if code in {"404", "NoSuchKey", "NotFound"}:
+                    size_missing = True
+                else:
+                    raise
 
         # Lock mismatch => 409 + X-WOPI-Lock=current lock value (or "" if unlocked)
         if current_lock_value:
@@ -449,7 +467,7 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
         # workaround strictly to the editnew placeholder case (size==0 + CREATING).
         delete_placeholder = (
             not size_missing
-            and int(current_size or 0) == 0
+            and current_size == 0
             and item.upload_state == ItemUploadStateChoices.CREATING
         )
         if delete_placeholder:
@@ -481,6 +499,7 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
                 content_type=str(
                     request.content_type or item.mimetype or "application/octet-stream"
                 ),
+                max_concurrency=settings.WOPI_PUT_FILE_UPLOAD_CONCURRENCY,
             )
         except RequestDataTooBig:
             return Response(status=413)
@@ -500,7 +519,7 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
             "body_size=%s delete_placeholder=%s ms_total=%s ms_save=%s ms_head=%s)",
             item.id,
             bool(current_lock_value),
-            "missing" if size_missing else str(int(current_size or 0)),
+            "missing" if size_missing else (str(current_size) if head_needed else "skipped"),
             body_size,
             delete_placeholder,
             total_ms,
@@ -513,8 +532,7 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
         """Item detail POST actions require update permission."""
 
         _ = pk
-        item = request.auth.item
-        abilities = item.get_abilities(request.user)
+        abilities = self._get_item_abilities(request)
         if not abilities["update"]:
             return Response(status=401)
         return None
@@ -531,7 +549,7 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
         Rename the file
         """
         item = request.auth.item
-        abilities = item.get_abilities(request.user)
+        abilities = self._get_item_abilities(request)
 
         if not abilities["update"]:
             return Response(status=401)
@@ -546,12 +564,10 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
 
         # Convert it to utf-7 to avoid issues with special characters
         new_filename = new_filename.encode("ascii").decode("utf-7")
-        lock_service = LockService(item)
-        if lock_service.is_locked():
-            current_lock_value = lock_service.get_lock(default="")
-            lock_value = request.META.get(HTTP_X_WOPI_LOCK)
-            if current_lock_value != lock_value:
-                return Response(status=409, headers={X_WOPI_LOCK: current_lock_value})
+        # A single read: an empty value means the file is unlocked.
+        current_lock_value = LockService(item).get_lock(default="")
+        if current_lock_value and current_lock_value != request.META.get(HTTP_X_WOPI_LOCK):
+            return Response(status=409, headers={X_WOPI_LOCK: current_lock_value})
 
         _, current_extension = splitext(item.filename)
         new_filename_with_extension = f"{new_filename}{current_extension}"
@@ -576,23 +592,35 @@ class WopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewsets.Vi
         item.filename = new_filename_with_extension
         item.title = new_filename
 
-        # ensure renaming the file in the database and on the storage are done atomically
-        with transaction.atomic():
-            item.save(update_fields=["filename", "title", "updated_at"])
+        # Copy the object before saving the new filename, so the item row is not
+        # locked for the duration of the storage copy.
+        s3_client = default_storage.connection.meta.client
+        # Don't catch any s3 error, if failing let the exception raises to sentry:
+        # nothing has been saved yet.
+        copy_result = copy_regular_storage_object(
+            s3_client=s3_client,
+            bucket=default_storage.bucket_name,
+            source_key=file_key,
+            destination_key=item.file_key,
+            metadata_directive="COPY",
+            source_head=head_object,
+            source_version_id=head_object.get("VersionId"),
+        )
 
-            # Rename the file in the storage
-            s3_client = default_storage.connection.meta.client
-            # Don't catch any s3 error, if failing let the exception raises to sentry
-            # the transaction will be rolled back
-            copy_regular_storage_object(
-                s3_client=s3_client,
-                bucket=default_storage.bucket_name,
-                source_key=file_key,
-                destination_key=item.file_key,
-                metadata_directive="COPY",
-                source_head=head_object,
-                source_version_id=head_object.get("VersionId"),
-            )
+        try:
+            item.save(update_fields=["filename", "title", "updated_at"])
+        except Exception:
+            # The item still points to the old key: drop the copy, keep the source.
+            delete_kwargs = {"Bucket": default_storage.bucket_name, "Key": item.file_key}
+            if copy_result.version_id:
+                delete_kwargs["VersionId"] = copy_result.version_id
+            try:
+                s3_client.delete_object(**delete_kwargs)
+            # pylint: disable=broad-exception-caught
+            except Exception as e:  # noqa
+                capture_exception(e)
+                logger.warning("Error deleting renamed copy for item %s in the storage", item.id)
+            raise
 
         try:
             delete_kwargs = {
@@ -633,6 +661,15 @@ class MountWopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewse
         """Get the file id from the URL path."""
         return uuid.UUID(self.kwargs.get("pk"))
 
+    @staticmethod
+    def _mount_wopi_ids(request) -> tuple[str, str]:
+        """Return the `(mount_id, normalized_path)` carried by the WOPI access token."""
+        ctx = request.auth
+        return (
+            str(getattr(ctx, "mount_id", "") or "").strip(),
+            str(getattr(ctx, "normalized_path", "") or ""),
+        )
+
     def _mount_capabilities(self, mount: dict) -> dict[str, bool]:
         """Return normalized capability flags for the given mount."""
         params = mount.get("params") if isinstance(mount.get("params"), dict) else {}
@@ -690,9 +727,7 @@ class MountWopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewse
     # pylint: disable=unused-argument
     def retrieve(self, request, pk=None):
         """WOPI CheckFileInfo operation for mount-backed files."""
-        ctx = request.auth
-        mount_id = str(getattr(ctx, "mount_id", "") or "").strip()
-        normalized_path = str(getattr(ctx, "normalized_path", "") or "")
+        mount_id, normalized_path = self._mount_wopi_ids(request)
 
         target, status_code = self._resolve_wopi_target(
             mount_id=mount_id,
@@ -724,9 +759,7 @@ class MountWopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewse
 
     def _get_file_content(self, request, pk=None):
         """WOPI GetFile operation for mount-backed files (streaming)."""
-        ctx = request.auth
-        mount_id = str(getattr(ctx, "mount_id", "") or "").strip()
-        normalized_path = str(getattr(ctx, "normalized_path", "") or "")
+        mount_id, normalized_path = self._mount_wopi_ids(request)
 
         target, status_code = self._resolve_wopi_target(
             mount_id=mount_id,
@@ -742,7 +775,7 @@ class MountWopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewse
         if preflight_response is not None:
             return preflight_response
 
-        chunk_size = 64 * 1024
+        chunk_size = WOPI_IO_CHUNK_SIZE
 
         def _stream():
             try:
@@ -782,13 +815,11 @@ class MountWopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewse
         request,
     ) -> tuple[int, str | None, int]:
         """Stream request bytes to the provider and return (status, version, bytes)."""
-        ctx = request.auth
-        mount_id = str(getattr(ctx, "mount_id", "") or "").strip()
-        normalized_path = str(getattr(ctx, "normalized_path", "") or "")
+        mount_id, normalized_path = self._mount_wopi_ids(request)
         bytes_written = 0
 
         try:
-            chunk_size = 64 * 1024
+            chunk_size = WOPI_IO_CHUNK_SIZE
             stream = getattr(request, "_request", request)
             with target.provider.open_write(
                 mount=target.mount,
@@ -839,9 +870,7 @@ class MountWopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewse
         if preflight_response is not None:
             return preflight_response
 
-        ctx = request.auth
-        mount_id = str(getattr(ctx, "mount_id", "") or "").strip()
-        normalized_path = str(getattr(ctx, "normalized_path", "") or "")
+        mount_id, normalized_path = self._mount_wopi_ids(request)
 
         target, status_code = self._resolve_wopi_target(
             mount_id=mount_id,
@@ -850,10 +879,10 @@ class MountWopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewse
         if not target:
             return Response(status=status_code)
 
-        lock_service = MountLockService(mount_id=mount_id, normalized_path=normalized_path)
         lock_value = request.META.get(HTTP_X_WOPI_LOCK)
 
         if lock_value:
+            lock_service = MountLockService(mount_id=mount_id, normalized_path=normalized_path)
             current_lock_value = lock_service.get_lock(default="")
             if current_lock_value != lock_value:
                 return self._lock_conflict_response(current_lock_value=current_lock_value)
@@ -880,9 +909,7 @@ class MountWopiViewSet(WopiFileContentRuntimeMixin, WopiLockRuntimeMixin, viewse
         """Return the mount-backed lock service for shared lock lifecycle actions."""
 
         _ = pk
-        ctx = request.auth
-        mount_id = str(getattr(ctx, "mount_id", "") or "").strip()
-        normalized_path = str(getattr(ctx, "normalized_path", "") or "")
+        mount_id, normalized_path = self._mount_wopi_ids(request)
         if not self._wopi_mount_or_none(mount_id):
             return Response(status=404)
         return MountLockService(mount_id=mount_id, normalized_path=normalized_path)